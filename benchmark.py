@@ -0,0 +1,394 @@
+"""PyIDE performans ölçümleri.
+
+Kullanım:
+    python benchmark.py highlight [--lines 20000]
+    python benchmark.py scroll [--lines 20000] [--rate 240]
+    python benchmark.py complete [--symbols 100000] [--queries 200]
+    python benchmark.py search [--files 5000] [--lines 200]
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QSyntaxHighlighter, QTextDocument
+from PyQt5.QtCore import QRegExp, QEventLoop, QTimer
+
+from ide import Pide, ModernCodeEditor, FuzzyIndex, ProjectSearch, TrigramIndex, compile_search
+
+
+SAMPLE_CODE = '''import os
+import sys
+
+
+class Worker(object):
+    """Example worker"""
+
+    def __init__(self, name, count=10):
+        self.name = name
+        self.count = count  # default count
+
+    def run(self, items):
+        total = 0
+        for index, item in enumerate(items):
+            if isinstance(item, int) and item > 3.5:
+                total += len(str(item)) * 2
+            elif item is None:
+                print("skip", index, 'none')
+        return max(total, 0)
+
+
+def main():
+    worker = Worker(os.getcwd())
+    result = worker.run(range(100))
+    sys.stdout.write(str(result))
+'''
+
+
+class LegacyPide(QSyntaxHighlighter):
+    """Eski motor: keyword/builtin başına ayrı QRegExp taraması"""
+    def __init__(self, document, reference):
+        super().__init__(document)
+        self.rules = []
+        for word in reference.KEYWORDS:
+            self.rules.append((QRegExp(rf'\b{word}\b'), reference.keyword_format))
+        for func in reference.BUILTINS:
+            self.rules.append((QRegExp(rf'\b{func}\b(?=\()'), reference.function_format_success))
+        self.rules.append((QRegExp(r'\b\d+\.?\d*\b'), reference.number_format))
+        for pattern in [r'".*?"', r"'.*?'", r'""".*?"""', r"'''.*?'''"]:
+            self.rules.append((QRegExp(pattern), reference.string_format))
+        self.rules.append((QRegExp(r'#.*'), reference.comment_format))
+        self.variable_pattern = QRegExp(r'\b(\w+)\s*=')
+        self.word_pattern = QRegExp(r'\b\w+')
+        self.reference = reference
+
+    def highlightBlock(self, text):
+        for pattern, fmt in self.rules:
+            index = pattern.indexIn(text)
+            while index >= 0:
+                length = pattern.matchedLength()
+                self.setFormat(index, length, fmt)
+                index = pattern.indexIn(text, index + length)
+        # Eski değişken taraması: '=' öncesindeki her kelime
+        index = self.variable_pattern.indexIn(text)
+        while index >= 0:
+            self.setFormat(index, len(self.variable_pattern.cap(1)), self.reference.variable_format_decl)
+            index = self.variable_pattern.indexIn(text, index + self.variable_pattern.matchedLength())
+        # Ortak adım (import) iki motorda da aynı; eski motor string/yorum ayırmaz
+        index = self.word_pattern.indexIn(text)
+        word_starts = set()
+        while index >= 0:
+            word_starts.add(index)
+            index = self.word_pattern.indexIn(text, index + self.word_pattern.matchedLength())
+        self.reference._highlight_imports(text, word_starts, self.setFormat)
+
+
+def _make_document(lines):
+    sample = SAMPLE_CODE.split('\n')
+    repeat = lines // len(sample) + 1
+    return QTextDocument('\n'.join((sample * repeat)[:lines]))
+
+
+def _time_rehighlight(highlighter, rounds):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        highlighter.rehighlight()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_highlight(args):
+    """Blok başına highlight maliyeti (eski vs yeni motor)"""
+    document = _make_document(args.lines)
+    blocks = document.blockCount()
+
+    # Yeni motor (değişken konumları için önce parse edilir)
+    pide = Pide(document)
+    pide.rehighlight()
+    pide.parse_full_document()
+    new_time = _time_rehighlight(pide, args.rounds)
+    pide.setDocument(None)
+
+    # Eski motor (yalnızca kural taraması)
+    legacy = LegacyPide(document, pide)
+    old_time = _time_rehighlight(legacy, args.rounds)
+    legacy.setDocument(None)
+
+    print(f"Blocks: {blocks}")
+    print(f"Legacy  : {old_time * 1000:9.1f} ms total, {old_time / blocks * 1e6:7.2f} us/block")
+    print(f"Pide    : {new_time * 1000:9.1f} ms total, {new_time / blocks * 1e6:7.2f} us/block")
+    print(f"Speedup : {old_time / new_time:.1f}x")
+
+
+def bench_scroll(args):
+    """Scroll ağırlıklı iş yükünde minimap/satır numarası repaint maliyeti"""
+    app = QApplication.instance()
+    sample = SAMPLE_CODE.split('\n')
+    editor = ModernCodeEditor()
+    editor.resize(900, 700)
+    editor.show()
+    editor.setPlainText('\n'.join((sample * (args.lines // len(sample) + 1))[:args.lines]))
+    # Module çözümlemesi sonrası yeniden boyama ölçüme karışmasın
+    editor.highlighter.parse_full_document()
+    deadline = time.perf_counter() + 10
+    while editor.highlighter.pending_modules and time.perf_counter() < deadline:
+        app.processEvents()
+    app.processEvents()
+
+    for widget in (editor.minimap, editor.line_number_area):
+        widget.paint_stats.reset()
+    editor.repaints.requests = editor.repaints.frames = 0
+
+    # Saniyede args.rate scroll adımı (wheel/trackpad benzeri)
+    bar = editor.verticalScrollBar()
+    interval = 1.0 / args.rate
+    start = time.perf_counter()
+    for step in range(args.steps):
+        bar.setValue(step * 3 % max(1, bar.maximum()))
+        deadline = start + (step + 1) * interval
+        while time.perf_counter() < deadline:
+            app.processEvents()
+    elapsed = time.perf_counter() - start
+
+    print(f"Scroll steps: {args.steps} in {elapsed:.2f} s ({args.steps / elapsed:.0f}/s)")
+    for name, widget in (('Minimap', editor.minimap), ('Gutter', editor.line_number_area)):
+        fps, average, worst = widget.paint_stats.summary()
+        print(f"{name:8}: {fps:6.1f} fps, {average:6.2f} ms avg, {worst:6.2f} ms worst")
+    print(f"Coalesced: {editor.repaints.requests} requests -> {editor.repaints.frames} frames")
+
+
+SYMBOL_PARTS = (
+    'get set load save read write parse build make create update delete find index cache '
+    'file path name value data item node tree block line text widget editor model view '
+    'config manager handler buffer stream token symbol module project result error event '
+    'async local global max min count size total first last next prev http json user'
+).split()
+
+
+def _make_symbols(count, seed=1):
+    """snake_case, camelCase ve PascalCase karışık sentetik semboller"""
+    rng = random.Random(seed)
+    symbols = set()
+    while len(symbols) < count:
+        parts = rng.sample(SYMBOL_PARTS, rng.randint(2, 4))
+        style = rng.randrange(3)
+        if style == 0:
+            symbol = '_'.join(parts)
+        elif style == 1:
+            symbol = parts[0] + ''.join(part.title() for part in parts[1:])
+        else:
+            symbol = ''.join(part.title() for part in parts)
+        if rng.random() < 0.2:
+            symbol += str(rng.randint(0, 99))
+        symbols.add(symbol)
+    return sorted(symbols)
+
+
+def _make_queries(symbols, count, seed=2):
+    """Prefix, kısaltma (camelCase/snake_case baş harfleri) ve rastgele subsequence sorguları"""
+    rng = random.Random(seed)
+    queries = []
+    for index in range(count):
+        symbol = rng.choice(symbols)
+        kind = index % 3
+        if kind == 0:
+            query = symbol[:rng.randint(1, 5)]
+        elif kind == 1:
+            query = ''.join(symbol[position] for position in FuzzyIndex.boundaries(symbol))
+        else:
+            positions = sorted(rng.sample(range(len(symbol)), min(len(symbol), rng.randint(2, 5))))
+            query = ''.join(symbol[position] for position in positions)
+        queries.append(query.lower() if rng.random() < 0.5 else query)
+    return queries
+
+
+def _linear_search(symbols, query, limit):
+    """Karşılaştırma: index'siz, her sembolü puanlayan tarama"""
+    query_lower = query.lower()
+    scored = []
+    for word in symbols:
+        score = FuzzyIndex.score(word, word.lower(), FuzzyIndex.boundaries(word), query, query_lower)
+        if score is not None:
+            scored.append((score, word))
+    scored.sort(reverse=True)
+    return scored[:limit]
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def bench_complete(args):
+    """Fuzzy autocomplete: index kurulumu ve sorgu süreleri (indexli vs lineer tarama)"""
+    symbols = _make_symbols(args.symbols)
+    queries = _make_queries(symbols, args.queries)
+
+    start = time.perf_counter()
+    index = FuzzyIndex(symbols)
+    build_time = time.perf_counter() - start
+
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, args.limit)
+        timings.append(time.perf_counter() - start)
+
+    linear = []
+    for query in queries[:args.linear_queries]:
+        start = time.perf_counter()
+        _linear_search(symbols, query, args.limit)
+        linear.append(time.perf_counter() - start)
+
+    print(f"Symbols : {len(index)} (build {build_time * 1000:.0f} ms)")
+    print(f"Indexed : {sum(timings) / len(timings) * 1000:7.2f} ms avg, "
+          f"{_percentile(timings, 0.95) * 1000:7.2f} ms p95, {max(timings) * 1000:7.2f} ms worst "
+          f"({len(timings)} queries)")
+    if linear:
+        print(f"Linear  : {sum(linear) / len(linear) * 1000:7.2f} ms avg, "
+              f"{max(linear) * 1000:7.2f} ms worst ({len(linear)} queries)")
+    for query in queries[:5]:
+        print(f"  {query!r:12} -> {[word for _, word in index.search(query, 3)]}")
+
+
+SEARCH_NEEDLE = 'rare_needle_token'
+
+SEARCH_QUERIES = (
+    ('rare literal', SEARCH_NEEDLE, {}),
+    ('rare regex', r'rare_needle_(token|marker)\(', {'regex': True}),
+    ('word, case', 'RareNeedle', {'case_sensitive': True, 'whole_word': True}),
+    ('common', 'return', {}),
+    ('no literal', r'[0-9]{5}', {'regex': True}),
+)
+
+
+def _make_project(root, files, lines, hits, seed=3):
+    """Sentetik proje: klasörlere dağılmış, sembol sözlüğünden üretilmiş .py dosyaları"""
+    rng = random.Random(seed)
+    symbols = _make_symbols(5000, seed)
+    needles = set(rng.sample(range(files), hits))
+    for index in range(files):
+        folder = os.path.join(root, f"pkg{index % 50}", f"sub{index % 7}")
+        os.makedirs(folder, exist_ok=True)
+        body = []
+        for line in range(lines):
+            name, other = rng.choice(symbols), rng.choice(symbols)
+            kind = line % 4
+            if kind == 0:
+                body.append(f"def {name}({other}, count={rng.randint(0, 99)}):")
+            elif kind == 1:
+                body.append(f"    {name} = {other}.{rng.choice(SYMBOL_PARTS)}()")
+            elif kind == 2:
+                body.append(f"    # {rng.choice(SYMBOL_PARTS)} {other} {rng.choice(SYMBOL_PARTS)}")
+            else:
+                body.append(f"    return {name} + {rng.randint(0, 9999)}")
+        if index in needles:
+            body.insert(rng.randrange(len(body)), f"    {SEARCH_NEEDLE}(RareNeedle)")
+        with open(os.path.join(folder, f"module_{index}.py"), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(body) + '\n')
+
+
+def _run_search(search, root, pattern, prefilter, index=None, verify=True):
+    """Aramayı başlat ve bitmesini event loop'ta bekle: (açılan dosya, eşleşme, süre)"""
+    result = {}
+    loop = QEventLoop()
+
+    def on_finished(generation, files, total, elapsed):
+        if generation == current:
+            result['stats'] = (files, total, elapsed)
+            loop.quit()
+
+    search.finished.connect(on_finished)
+    current = search.start(root, pattern, prefilter, index, verify)
+    QTimer.singleShot(120000, loop.quit)
+    loop.exec_()
+    search.finished.disconnect(on_finished)
+    return result['stats']
+
+
+def bench_search(args):
+    """Find in Files: trigram index ile aday dosyalar vs tüm dosyaları okuyan tarama"""
+    root = tempfile.mkdtemp(prefix='pyide-search-')
+    try:
+        _make_project(root, args.files, args.lines, args.hits)
+        size_mb = sum(os.path.getsize(path) for path in ProjectSearch.iter_files(root)) / (1024 * 1024)
+
+        index = TrigramIndex()
+        index.INDEX_DIR = os.path.join(root, '.pyide')  # Kullanıcının cache'i kirlenmesin
+        start = time.perf_counter()
+        index.index(root).join()
+        cold = time.perf_counter() - start
+        index = TrigramIndex()
+        index.INDEX_DIR = os.path.join(root, '.pyide')
+        start = time.perf_counter()
+        index.index(root).join()
+        warm = time.perf_counter() - start
+        cache_mb = os.path.getsize(index.cache_file(root)) / (1024 * 1024)
+
+        print(f"Project : {len(index)} files, {size_mb:.1f} MB")
+        print(f"Index   : {cold * 1000:.0f} ms cold, {warm * 1000:.0f} ms from cache ({cache_mb:.1f} MB on disk)")
+        print(f"{'query':12} {'brute force':>22} {'index + stat check':>24} {'index only':>22}  matches")
+        search = ProjectSearch()
+        for name, text, options in SEARCH_QUERIES:
+            pattern = compile_search(text, **options)
+            prefilter = ProjectSearch.prefilter_for(text, options.get('case_sensitive', False),
+                                                    options.get('regex', False))
+            row = []
+            counts = set()
+            for run_index, verify in ((None, True), (index, True), (index, False)):
+                timings = []
+                for _ in range(args.rounds):
+                    files, total, elapsed = _run_search(search, root, pattern, prefilter, run_index, verify)
+                    timings.append(elapsed)
+                counts.add(total)
+                row.append(f"{min(timings) * 1000:8.1f} ms {files:6} files")
+            same = "" if len(counts) == 1 else "  MISMATCH"
+            print(f"{name:12} {row[0]:>22} {row[1]:>24} {row[2]:>22}  {total}{same}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyIDE benchmarks")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    highlight = sub.add_parser('highlight', help=bench_highlight.__doc__)
+    highlight.add_argument('--lines', type=int, default=20000)
+    highlight.add_argument('--rounds', type=int, default=3)
+    highlight.set_defaults(func=bench_highlight)
+
+    scroll = sub.add_parser('scroll', help=bench_scroll.__doc__)
+    scroll.add_argument('--lines', type=int, default=20000)
+    scroll.add_argument('--steps', type=int, default=600)
+    scroll.add_argument('--rate', type=int, default=240)
+    scroll.set_defaults(func=bench_scroll)
+
+    complete = sub.add_parser('complete', help=bench_complete.__doc__)
+    complete.add_argument('--symbols', type=int, default=100000)
+    complete.add_argument('--queries', type=int, default=200)
+    complete.add_argument('--limit', type=int, default=50)
+    complete.add_argument('--linear-queries', type=int, default=10)
+    complete.set_defaults(func=bench_complete)
+
+    search = sub.add_parser('search', help=bench_search.__doc__)
+    search.add_argument('--files', type=int, default=5000)
+    search.add_argument('--lines', type=int, default=200)
+    search.add_argument('--hits', type=int, default=20)
+    search.add_argument('--rounds', type=int, default=3)
+    search.set_defaults(func=bench_search)
+
+    args = parser.parse_args()
+    app = QApplication(sys.argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,37 +2,1209 @@ import sys
 import os
 import subprocess
 import ast
+import bisect
+import difflib
+import hashlib
+import heapq
 import importlib
+import importlib.machinery
+import itertools
+import stat
 import tempfile
 import time
 import re
+import json
+import queue
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QPlainTextEdit, QTextEdit, QPushButton,
     QLabel, QVBoxLayout, QHBoxLayout, QSplitter, QFileDialog, QAction, QTabWidget,
     QToolBar, QMenuBar, QMessageBox, QFrame, QTreeWidget, QTreeWidgetItem, QInputDialog,
-    QDialog, QListWidget, QLineEdit, QProgressBar, QCompleter, QCheckBox, QMenu
+    QDialog, QListWidget, QListWidgetItem, QLineEdit, QProgressBar, QCompleter, QCheckBox, QMenu
 )
 
 from PyQt5.QtGui import (  
-    QSyntaxHighlighter, QTextCharFormat, QColor, QFont, QTextCursor, QPainter, QTextFormat, QIcon, QTextDocument
+    QSyntaxHighlighter, QTextCharFormat, QColor, QFont, QTextCursor, QPainter, QTextFormat, QIcon, QTextDocument,
+    QTextBlockUserData, QImage, QStaticText, QTransform, QPolygonF
 )
 
-from PyQt5.QtCore import QRegExp, Qt, QRect, QSize, QTimer, QProcess, QStringListModel, QFileSystemWatcher
+from PyQt5 import sip
+from PyQt5.QtCore import (
+    QRegExp, Qt, QRect, QSize, QPoint, QPointF, QTimer, QProcess, QStringListModel, QFileSystemWatcher, QObject, pyqtSignal,
+    QEvent
+)
+
+# Kullanıcıya ait kalıcı cache dosyaları
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.pyide')
+
+# File tree, watcher ve proje indexi tarafından atlanan klasörler
+SKIP_DIRS = frozenset({'.git', '__pycache__', '.vscode', '.idea', 'node_modules', 'venv', '.env'})
+
+
+def _skip_dir(name):
+    """File tree'de gösterilmeyen klasör: SKIP_DIRS ve gizli (.) klasörler"""
+    return name in SKIP_DIRS or name.startswith('.')
+
+
+def _write_json_atomic(path, data):
+    """JSON dosyasını geçici dosya + rename ile yaz"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def compile_search(text, case_sensitive=False, whole_word=False, regex=False):
+    """Arama seçeneklerinden Python regex'i derle (geçersiz regex'te re.error)"""
+    pattern = text if regex else re.escape(text)
+    if whole_word:
+        pattern = rf'\b(?:{pattern})\b'
+    flags = re.MULTILINE
+    if not case_sensitive:
+        flags |= re.IGNORECASE
+    return re.compile(pattern, flags)
+
+
+def replace_matches(pattern, text, replacement, expand=False):
+    """Tüm eşleşmeleri tek geçişte değiştir.
+
+    (eşleşme sayısı, ilk eşleşme başı, son eşleşme sonu, aradaki yeni metin) döner;
+    expand ile \\1, \\g<name> grupları açılır (geçersiz şablonda re.error).
+    """
+    pieces = []
+    first = last = None
+    count = 0
+    for match in pattern.finditer(text):
+        start, end = match.span()
+        if first is None:
+            first = start
+        else:
+            pieces.append(text[last:start])
+        pieces.append(match.expand(replacement) if expand else replacement)
+        last = end
+        count += 1
+    return count, first, last, ''.join(pieces)
+
+
+def _write_text_atomic(path, text):
+    """Metni olduğu gibi (satır sonu çevirmeden) geçici dosya + rename ile yaz; izinler korunur"""
+    directory = os.path.dirname(os.path.abspath(path))
+    mode = stat.S_IMODE(os.stat(path).st_mode) if os.path.exists(path) else None
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ModuleResolver(QObject):
+    """Module attribute isimlerini GUI thread dışında, ayrı bir süreçte çözer"""
+    resolved = pyqtSignal(str, object)  # module adı, frozenset(isimler) veya None (başarısız)
+
+    CACHE_FILE = os.path.join(CACHE_DIR, 'module_cache.json')
+    TIMEOUT = 30
+
+    # Import yan etkileri IDE sürecine değil bu alt sürece ait olur
+    INTROSPECT_SCRIPT = (
+        "import importlib, json, sys\n"
+        "module = importlib.import_module(sys.argv[1])\n"
+        "sys.stdout.write('\\n' + json.dumps(sorted(dir(module))))\n"
+    )
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._pending = set()
+        self._disk = self._load_disk_cache()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def _load_disk_cache(self):
+        try:
+            with open(self.CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def module_key(module_name):
+        """Module'ü import etmeden (origin, mtime) anahtarını bul"""
+        if module_name in sys.builtin_module_names:
+            return ['built-in', sys.version]
+
+        search_path = None
+        spec = None
+        for part in range(1, module_name.count('.') + 2):
+            name = '.'.join(module_name.split('.')[:part])
+            try:
+                spec = importlib.machinery.PathFinder.find_spec(name, search_path)
+            except (ImportError, ValueError):
+                return None
+            if spec is None:
+                return None
+            search_path = spec.submodule_search_locations
+
+        origin = spec.origin
+        if not origin or not os.path.exists(origin):
+            # Namespace package: ilk arama dizini
+            locations = list(spec.submodule_search_locations or [])
+            if not locations:
+                return None
+            origin = locations[0]
+        try:
+            return [origin, os.path.getmtime(origin)]
+        except OSError:
+            return None
+
+    def request(self, module_name):
+        """Module'ü arka planda çözümlemek için kuyruğa ekle"""
+        with self._lock:
+            if module_name not in self._pending:
+                self._pending.add(module_name)
+                self._queue.put(module_name)
+
+    def _run(self):
+        while True:
+            module_name = self._queue.get()
+            try:
+                key = self.module_key(module_name)
+                names = self._from_disk(module_name, key)
+                if names is None:
+                    names = self._introspect(module_name)
+                    if key is not None and names is not None:
+                        self._store_disk(module_name, key, names)
+            except Exception as e:
+                print(f"Module resolver error ({module_name}): {e}")
+                key, names = None, None
+
+            with self._lock:
+                self._pending.discard(module_name)
+            self.resolved.emit(module_name, names)
+
+    def _from_disk(self, module_name, key):
+        entry = self._disk.get(module_name)
+        if key is None or not entry or entry.get('key') != key:
+            return None
+        return frozenset(entry['names'])
+
+    def _store_disk(self, module_name, key, names):
+        self._disk[module_name] = {'key': key, 'names': sorted(names)}
+        _write_json_atomic(self.CACHE_FILE, self._disk)
+
+    def _introspect(self, module_name):
+        try:
+            result = subprocess.run(
+                [sys.executable, '-c', self.INTROSPECT_SCRIPT, module_name],
+                capture_output=True,
+                text=True,
+                timeout=self.TIMEOUT,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        try:
+            # Import sırasında yazılan çıktılar olabilir; son satır JSON
+            return frozenset(json.loads(result.stdout.rsplit('\n', 1)[-1]))
+        except ValueError:
+            return None
+
+
+class SymbolRegistry(QObject):
+    """Tüm highlighter'ların paylaştığı module -> attribute isimleri cache'i"""
+    changed = pyqtSignal(str, object)  # module adı, frozenset veya None
+
+    # Hiçbir dokümanın kullanmadığı en fazla bu kadar module bellekte tutulur
+    CAPACITY = 64
+    # Çözülemeyen module bu süre sonra yeniden denenir (sonradan kurulmuş olabilir)
+    FAILURE_TTL = 60
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = OrderedDict()  # name -> frozenset veya None, LRU sırasında
+        self._failed_at = {}  # None entry'lerin çözülemediği an (time.monotonic)
+        self._refs = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.resolver = ModuleResolver.instance()
+        self.resolver.resolved.connect(self._on_resolved)
+
+    def acquire(self, module_name):
+        """Module'e referans al; çözülmüşse (True, isimler) döner"""
+        self._refs[module_name] = self._refs.get(module_name, 0) + 1
+        if self._failure_expired(module_name):
+            # Eski başarısızlık: cache'ten düşür, yeniden çözülsün
+            del self._entries[module_name]
+            del self._failed_at[module_name]
+        if module_name in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(module_name)
+            return True, self._entries[module_name]
+        self.misses += 1
+        self.resolver.request(module_name)
+        return False, None
+
+    def release(self, module_name):
+        count = self._refs.get(module_name, 0) - 1
+        if count > 0:
+            self._refs[module_name] = count
+            return
+        self._refs.pop(module_name, None)
+        self._evict()
+
+    def symbols(self, module_name):
+        return self._entries.get(module_name)
+
+    def retry(self, module_name):
+        """Süresi dolmuş başarısız çözümlemeyi arka planda yeniden iste (sonuç changed ile gelir)"""
+        if self._failure_expired(module_name):
+            self._failed_at[module_name] = time.monotonic()  # Sonuç gelene kadar tekrar istenmesin
+            self.resolver.request(module_name)
+
+    def _failure_expired(self, module_name):
+        failed_at = self._failed_at.get(module_name)
+        return failed_at is not None and time.monotonic() - failed_at > self.FAILURE_TTL
+
+    def _on_resolved(self, module_name, names):
+        self._entries[module_name] = names
+        if names is None:
+            self._failed_at[module_name] = time.monotonic()
+        else:
+            self._failed_at.pop(module_name, None)
+        self._entries.move_to_end(module_name)
+        self._evict()
+        self.changed.emit(module_name, names)
+
+    def _evict(self):
+        unreferenced = [name for name in self._entries if name not in self._refs]
+        for name in unreferenced[:max(0, len(unreferenced) - self.CAPACITY)]:
+            del self._entries[name]
+            self._failed_at.pop(name, None)
+            self.evictions += 1
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'entries': len(self._entries),
+            'referenced': len(self._refs),
+            'evictions': self.evictions,
+        }
+
+
+class FuzzyIndex:
+    """Fuzzy (subsequence) completion için önceden hesaplanmış karakter indexi.
+
+    Kelimeler kısadan uzuna numaralanır. Her karakter için onu içeren ve onu kelime
+    sınırında (baş, '_' sonrası, camelCase büyük harf, rakam) içeren kelimelerin
+    bitmap'i (Python int) tutulur; sorgu bu bitmap'lerin AND'i ile daraltılır ve
+    yalnızca en kısa MAX_CANDIDATES aday (artı kısaltma ve prefix eşleşmeleri) puanlanır.
+    """
+    MAX_CANDIDATES = 300
+
+    # Puan ağırlıkları
+    MATCH = 1
+    BOUNDARY = 6
+    START = 8
+    CONSECUTIVE = 4
+    CASE = 1
+    PREFIX = 10
+
+    def __init__(self, words=()):
+        self.words = sorted(set(words), key=lambda word: (len(word), word.lower(), word))
+        self._lower = [word.lower() for word in self.words]
+        self._bounds = [self.boundaries(word) for word in self.words]
+
+        char_ids = {}
+        boundary_ids = {}
+        for index, (lower, bounds) in enumerate(zip(self._lower, self._bounds)):
+            for char in set(lower):
+                char_ids.setdefault(char, []).append(index)
+            for char in {lower[position] for position in bounds}:
+                boundary_ids.setdefault(char, []).append(index)
+        self._chars = {char: self._bitmap(ids) for char, ids in char_ids.items()}
+        self._boundary_chars = {char: self._bitmap(ids) for char, ids in boundary_ids.items()}
+
+        # Prefix eşleşmeleri için alfabetik sıra (bisect)
+        self._alphabetical = sorted(range(len(self.words)), key=self._lower.__getitem__)
+        self._alphabetical_keys = [self._lower[index] for index in self._alphabetical]
+
+    def __len__(self):
+        return len(self.words)
+
+    @staticmethod
+    def _bitmap(ids):
+        bits = bytearray(ids[-1] // 8 + 1)
+        for index in ids:
+            bits[index >> 3] |= 1 << (index & 7)
+        return int.from_bytes(bits, 'little')
+
+    @staticmethod
+    def boundaries(word):
+        """Kelime parçalarının başladığı konumlar (snake_case, camelCase, rakam)"""
+        bounds = []
+        previous = ''
+        for position, char in enumerate(word):
+            if (not previous or previous == '_' and char != '_'
+                    or char.isupper() and (not previous.isupper() or word[position + 1:position + 2].islower())
+                    or char.isdigit() and not previous.isdigit()):
+                bounds.append(position)
+            previous = char
+        return tuple(bounds)
+
+    @classmethod
+    def score(cls, word, lower, bounds, query, query_lower):
+        """Subsequence puanı; eşleşmiyorsa None. Sınırdaki eşleşmeler tercih edilir"""
+        total = cls.PREFIX if lower.startswith(query_lower) else 0
+        position = 0
+        previous = -1
+        for index, char in enumerate(query_lower):
+            found = lower.find(char, position)
+            if found < 0:
+                return None
+            if found != previous + 1 and found not in bounds:
+                # Kalan sorgu hâlâ eşleşiyorsa sonraki sınır konumunu kullan
+                rest = query_lower[index + 1:]
+                for bound in bounds:
+                    if bound > found and lower[bound] == char:
+                        remaining = iter(lower[bound + 1:])
+                        if all(c in remaining for c in rest):
+                            found = bound
+                        break
+            total += cls.MATCH
+            if found == 0:
+                total += cls.START
+            elif found in bounds:
+                total += cls.BOUNDARY
+            if found == previous + 1 and previous >= 0:
+                total += cls.CONSECUTIVE
+            if word[found] == query[index]:
+                total += cls.CASE
+            previous = found
+            position = found + 1
+        # Kısa kelimeler ve az atlanan karakter öne çıkar
+        return total - (len(word) - len(query)) * 0.1
+
+    def _ids(self, bitmap, limit):
+        """Bitmap'teki en küçük limit kadar kelime numarası"""
+        ids = []
+        bits = bin(bitmap)
+        last = len(bits) - 1
+        position = bits.rfind('1')
+        while position > 1 and len(ids) < limit:
+            ids.append(last - position)
+            position = bits.rfind('1', 0, position)
+        return ids
+
+    def search(self, query, limit=50):
+        """En iyi limit kadar (puan, kelime), puana göre azalan"""
+        if not query or not self.words:
+            return []
+        query_lower = query.lower()
+
+        bitmap = self._boundary_chars.get(query_lower[0], 0)
+        acronyms = bitmap
+        for char in set(query_lower[1:]):
+            if not bitmap:
+                return []
+            bitmap &= self._chars.get(char, 0)
+            acronyms &= self._boundary_chars.get(char, 0)
+        # Tüm karakterleri kelime sınırında olanlar (camelCase/snake_case kısaltmaları) ayrıca alınır
+        candidates = set(self._ids(bitmap, self.MAX_CANDIDATES))
+        candidates.update(self._ids(acronyms, self.MAX_CANDIDATES))
+
+        # Uzun prefix eşleşmeleri aday sınırına takılmasın
+        start = bisect.bisect_left(self._alphabetical_keys, query_lower)
+        for position in range(start, min(start + self.MAX_CANDIDATES, len(self._alphabetical_keys))):
+            if not self._alphabetical_keys[position].startswith(query_lower):
+                break
+            candidates.add(self._alphabetical[position])
+
+        scored = []
+        for index in candidates:
+            score = self.score(self.words[index], self._lower[index], self._bounds[index], query, query_lower)
+            if score is not None:
+                scored.append((score, -index, self.words[index]))
+        return [(score, word) for score, _, word in heapq.nlargest(limit, scored)]
+
+    @classmethod
+    def search_words(cls, words, query, limit=50):
+        """Index'siz küçük kümeler için (doküman isimleri): regex ile eleyip puanla"""
+        if not query:
+            return []
+        query_lower = query.lower()
+        pattern = re.compile('.*?'.join(map(re.escape, query_lower)), re.IGNORECASE)
+        scored = []
+        for word in words:
+            if pattern.search(word):
+                lower = word.lower()
+                bounds = cls.boundaries(word)
+                if not any(lower[bound] == query_lower[0] for bound in bounds):
+                    continue
+                score = cls.score(word, lower, bounds, query, query_lower)
+                if score is not None:
+                    scored.append((score, word))
+        return heapq.nlargest(limit, scored)
+
+
+class ProjectIndex(QObject):
+    """Proje .py dosyalarındaki top-level isimler; autocomplete için fuzzy index.
+
+    Tarama arka planda yapılır; dosya başına isimler mtime ile diskte saklanır,
+    böylece yeniden taramada yalnızca değişen dosyalar parse edilir.
+    """
+    indexed = pyqtSignal(object, object)  # (generation, FuzzyIndex)
+
+    INDEX_DIR = os.path.join(CACHE_DIR, 'project_index')
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.root = None
+        self._generation = 0
+        self.fuzzy = FuzzyIndex()  # Tarama thread'inde kurulur
+        self.indexed.connect(self._on_indexed)
+
+    def cache_file(self, root):
+        digest = hashlib.sha1(os.path.abspath(root).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.INDEX_DIR, digest + '.json')
+
+    def index(self, root):
+        """root altını arka planda (yeniden) tara; süren tarama iptal edilir"""
+        self.root = root
+        self._generation += 1
+        threading.Thread(target=self._run, args=(root, self._generation), daemon=True).start()
+
+    @staticmethod
+    def module_symbols(path):
+        """Module'ün top-level tanımları ve atamaları"""
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), path)
+        names = set()
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names.add(node.name)
+            elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                for target in targets:
+                    for child in ast.walk(target):
+                        if isinstance(child, ast.Name):
+                            names.add(child.id)
+        return sorted(names)
+
+    def _run(self, root, generation):
+        cache_file = self.cache_file(root)
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f).get('files', {})
+        except (OSError, ValueError, AttributeError):
+            cached = {}
+
+        files = {}
+        changed = False
+        for dirpath, dirnames, filenames in os.walk(root):
+            if generation != self._generation:
+                return
+            dirnames[:] = [d for d in dirnames if not _skip_dir(d)]
+            for filename in filenames:
+                if not filename.endswith('.py'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    continue
+                entry = cached.get(path)
+                if entry is None or entry[0] != mtime:
+                    try:
+                        names = self.module_symbols(path)
+                    except (OSError, SyntaxError, ValueError):
+                        names = []  # Dosya değişene kadar yeniden denenmez
+                    entry = [mtime, names]
+                    changed = True
+                files[path] = entry
+
+        if changed or len(files) != len(cached):
+            _write_json_atomic(cache_file, {'root': root, 'files': files})
+
+        symbols = set()
+        for path, (_, names) in files.items():
+            symbols.add(os.path.splitext(os.path.basename(path))[0])
+            symbols.update(names)
+        self.indexed.emit(generation, FuzzyIndex(symbols))
+
+    def _on_indexed(self, generation, fuzzy):
+        if generation == self._generation:
+            self.fuzzy = fuzzy
+
+    def __len__(self):
+        return len(self.fuzzy)
+
+
+class CompletionModel(QObject):
+    """Tüm editörlerin paylaştığı completion kelimeleri ve model.
+
+    Sabit kelime listesi ve fuzzy indexi ilk autocomplete isteğinde bir kez kurulur;
+    model her sorguda yalnızca en iyi eşleşmeleri (sabit + proje + doküman) puan
+    sırasıyla tutar.
+    """
+    SNIPPETS = {
+        'def': 'def function_name():\n    pass',
+        'class': 'class ClassName:\n    def __init__(self):\n        pass',
+        'if': 'if condition:\n    pass',
+        'for': 'for item in items:\n    pass',
+        'while': 'while condition:\n    pass',
+        'try': 'try:\n    pass\nexcept Exception as e:\n    pass',
+        'with': 'with open("file.txt", "r") as f:\n    content = f.read()',
+        'main': 'if __name__ == "__main__":\n    pass',
+        'init': 'def __init__(self):\n    pass',
+        'str': 'def __str__(self):\n    return ""',
+        'repr': 'def __repr__(self):\n    return ""',
+    }
+
+    # Python keywords ve builtins
+    KEYWORDS = [
+        'False', 'None', 'True', 'and', 'as', 'assert', 'async', 'await',
+        'break', 'class', 'continue', 'def', 'del', 'elif', 'else', 'except',
+        'finally', 'for', 'from', 'global', 'if', 'import', 'in', 'is',
+        'lambda', 'nonlocal', 'not', 'or', 'pass', 'raise', 'return',
+        'try', 'while', 'with', 'yield'
+    ]
+
+    BUILTINS = [
+        'abs', 'all', 'any', 'ascii', 'bin', 'bool', 'bytearray', 'bytes',
+        'callable', 'chr', 'classmethod', 'compile', 'complex', 'delattr',
+        'dict', 'dir', 'divmod', 'enumerate', 'eval', 'exec', 'filter',
+        'float', 'format', 'frozenset', 'getattr', 'globals', 'hasattr',
+        'hash', 'help', 'hex', 'id', 'input', 'int', 'isinstance',
+        'issubclass', 'iter', 'len', 'list', 'locals', 'map', 'max',
+        'memoryview', 'min', 'next', 'object', 'oct', 'open', 'ord',
+        'pow', 'print', 'property', 'range', 'repr', 'reversed', 'round',
+        'set', 'setattr', 'slice', 'sorted', 'staticmethod', 'str', 'sum',
+        'super', 'tuple', 'type', 'vars', 'zip', '__import__'
+    ]
+
+    # Common modules
+    MODULES = [
+        'os', 'sys', 'math', 'random', 'datetime', 'time', 'json', 're',
+        'collections', 'itertools', 'functools', 'pathlib', 'subprocess',
+        'threading', 'multiprocessing', 'requests', 'numpy', 'pandas'
+    ]
+
+    LIMIT = 50  # Popup'ta gösterilen en fazla öneri
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.words = sorted(set(self.KEYWORDS + self.BUILTINS + self.MODULES), key=lambda word: (word.lower(), word))
+        self.fuzzy = FuzzyIndex(self.words)
+        self.model = QStringListModel(self)
+        self._completer = None
+
+    def completer_for(self, editor):
+        """Paylaşılan QCompleter'ı editöre bağla (ilk çağrıda kurulur)"""
+        if self._completer is None:
+            self._completer = QCompleter(self.model, self)
+            # Model zaten sıralı fuzzy sonuçlarını tutar; QCompleter ayrıca prefix filtresi uygulamaz
+            self._completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+            self._completer.activated.connect(self._on_activated)
+
+            # Completer popup stili
+            self._completer.popup().setStyleSheet("""
+                QListView {
+                    background-color: #2d2d2d;
+                    color: #d4d4d4;
+                    border: 1px solid #007acc;
+                    selection-background-color: #094771;
+                    font-family: 'Consolas', monospace;
+                    font-size: 11pt;
+                }
+            """)
+        if self._completer.widget() is not editor:
+            self._completer.popup().hide()
+            self._completer.setWidget(editor)
+        return self._completer
+
+    def popup_visible(self, editor):
+        return (self._completer is not None and self._completer.widget() is editor
+                and self._completer.popup().isVisible())
+
+    def _on_activated(self, completion):
+        editor = self._completer.widget()
+        if editor is not None:
+            editor._insert_completion(completion)
+
+    def matches(self, query, local_words=(), limit=LIMIT):
+        """Sabit, proje ve doküman kelimelerinden fuzzy eşleşmeler, puana göre sıralı"""
+        scored = self.fuzzy.search(query, limit)
+        scored += ProjectIndex.instance().fuzzy.search(query, limit)
+        # Yazılmakta olan kelimenin kendisi önerilmez
+        scored += FuzzyIndex.search_words((word for word in local_words if word != query), query, limit)
+        best = {}
+        for score, word in scored:
+            if score > best.get(word, float('-inf')):
+                best[word] = score
+        return sorted(best, key=lambda word: (-best[word], len(word), word))[:limit]
+
+    def update(self, query, local_words=()):
+        """Paylaşılan modeli sorgunun sıralı sonuçlarıyla doldur (aynı anda tek popup açık olur)"""
+        words = self.matches(query, local_words)
+        if words != self.model.stringList():
+            self.model.setStringList(words)
+        return words
+
+
+class BlockData(QTextBlockUserData):
+    """Bloğa bağlı highlighter verisi (blok silinince Qt tarafından silinir)"""
+    def __init__(self, block):
+        super().__init__()
+        self.block = block  # QTextBlock handle'ı satır eklense de geçerli kalır
+        self.names = frozenset()
+        self.variables = {}          # sütun -> VariableCollector türü (son parse'tan)
+        self.variables_text = None   # variables'ın hesaplandığı satır metni
+
+
+class ParsedChunk:
+    """Tek bir top-level statement'ın parse sonucu"""
+    def __init__(self, start, end, imports, symbols, ok, variables=frozenset(), positions=None):
+        self.start = start          # ilk satır
+        self.end = end              # son satırdan sonraki satır
+        self.imports = imports      # import edilen module isimleri
+        self.symbols = symbols      # top-level tanımlanan isimler
+        self.ok = ok                # ast.parse başarılı mı
+        self.variables = variables  # module seviyesinde atanan değişkenler
+        self.positions = positions or {}  # göreli satır -> {sütun: değişken türü}
+
+
+class VariableScope:
+    """Bir fonksiyon/class/comprehension scope'unda bağlanan isimler"""
+    def __init__(self, kind, parent):
+        self.kind = kind
+        self.parent = parent
+        self.bound = set()
+        self.globals = set()
+        self.nonlocals = set()
+
+
+class VariableCollector(ast.NodeVisitor):
+    """Chunk AST'inden değişken tanım ve kullanım konumlarını scope'a göre çıkarır"""
+    DECLARATION = 1       # atama hedefi, parametre, döngü değişkeni
+    USAGE = 2             # aynı chunk'taki bir fonksiyon/class scope'unda tanımlı
+    MODULE_REFERENCE = 3  # module seviyesine çözülür; doküman genelindeki setle kontrol edilir
+
+    def __init__(self):
+        self.module = VariableScope('module', None)
+        self.scope = self.module
+        self.stores = []  # (lineno, col_offset)
+        self.loads = []   # (lineno, col_offset, isim, scope)
+
+    def collect(self, tree):
+        """{(lineno, col_offset): tür} ve module seviyesi değişken isimleri"""
+        self.visit(tree)
+        kinds = {position: self.DECLARATION for position in self.stores}
+        for lineno, col, name, scope in self.loads:
+            owner = self._resolve(name, scope)
+            if owner is None or owner is self.module:
+                kinds[(lineno, col)] = self.MODULE_REFERENCE
+            else:
+                kinds[(lineno, col)] = self.USAGE
+        return kinds, frozenset(self.module.bound)
+
+    def _resolve(self, name, scope):
+        if name in scope.globals:
+            return self.module if name in self.module.bound else None
+        current = scope
+        while current is not None:
+            # Class gövdesindeki isimler iç fonksiyonlardan görünmez
+            if name in current.bound and (current is scope or current.kind != 'class'):
+                return current
+            current = current.parent
+        return None
+
+    def _bind(self, name, lineno, col):
+        scope = self.scope
+        if name in scope.globals:
+            self.module.bound.add(name)
+        elif name not in scope.nonlocals:
+            scope.bound.add(name)
+        self.stores.append((lineno, col))
+
+    def _enter(self, kind):
+        self.scope = VariableScope(kind, self.scope)
+
+    def _leave(self):
+        self.scope = self.scope.parent
+
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Store):
+            self._bind(node.id, node.lineno, node.col_offset)
+        elif isinstance(node.ctx, ast.Load):
+            self.loads.append((node.lineno, node.col_offset, node.id, self.scope))
+
+    def visit_Global(self, node):
+        self.scope.globals.update(node.names)
+
+    def visit_Nonlocal(self, node):
+        self.scope.nonlocals.update(node.names)
+
+    def visit_ExceptHandler(self, node):
+        if node.name:
+            # 'except E as name': isim konumu AST'de yok, sadece bağlanır
+            self.scope.bound.add(node.name)
+        self.generic_visit(node)
+
+    def _visit_arguments(self, args):
+        """Default/annotation'lar dış scope'ta, parametreler yeni scope'ta"""
+        params = getattr(args, 'posonlyargs', []) + args.args + args.kwonlyargs
+        params += [arg for arg in (args.vararg, args.kwarg) if arg is not None]
+        for default in args.defaults + [d for d in args.kw_defaults if d is not None]:
+            self.visit(default)
+        for param in params:
+            if param.annotation is not None:
+                self.visit(param.annotation)
+        return params
+
+    def visit_FunctionDef(self, node):
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        params = self._visit_arguments(node.args)
+        if node.returns is not None:
+            self.visit(node.returns)
+        self._enter('function')
+        for param in params:
+            self._bind(param.arg, param.lineno, param.col_offset)
+        for statement in node.body:
+            self.visit(statement)
+        self._leave()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        params = self._visit_arguments(node.args)
+        self._enter('function')
+        for param in params:
+            self._bind(param.arg, param.lineno, param.col_offset)
+        self.visit(node.body)
+        self._leave()
+
+    def visit_ClassDef(self, node):
+        for expr in node.decorator_list + node.bases + [keyword.value for keyword in node.keywords]:
+            self.visit(expr)
+        self._enter('class')
+        for statement in node.body:
+            self.visit(statement)
+        self._leave()
+
+    def _visit_comprehension(self, node, *results):
+        # İlk iterable dış scope'ta değerlendirilir
+        self.visit(node.generators[0].iter)
+        self._enter('function')
+        for index, generator in enumerate(node.generators):
+            self.visit(generator.target)
+            if index:
+                self.visit(generator.iter)
+            for condition in generator.ifs:
+                self.visit(condition)
+        for result in results:
+            self.visit(result)
+        self._leave()
+
+    def visit_ListComp(self, node):
+        self._visit_comprehension(node, node.elt)
+
+    visit_SetComp = visit_GeneratorExp = visit_ListComp
+
+    def visit_DictComp(self, node):
+        self._visit_comprehension(node, node.key, node.value)
+
+
+class IncrementalParser:
+    """Dokümanı top-level statement'lara bölüp sadece değişenleri yeniden parse eder"""
+    CONTINUATION_KEYWORDS = frozenset(['else', 'elif', 'except', 'finally'])
+    IMPORT_LINE = re.compile(r'^\s*(?:from\s+([\w.]+)\s+import\b|import\s+(.+))')
+    # Pide tokenizer'ının string/yorum/parantez kısmı: statement sınırları highlighter
+    # state'ine bağlı kalmaz (lazy fill'in ulaşmadığı veya highlighter'sız bloklar)
+    LEXICAL_PATTERN = re.compile(r"""
+        \#.*
+      | "{3}.*?"{3}|'{3}.*?'{3}|"(?!"")(?:[^"\\]|\\.)*"|'(?!'')(?:[^'\\]|\\.)*'
+      | (?P<string_open>"{3}|'{3})
+      | (?P<bracket_open>[(\[{])
+      | (?P<bracket_close>[)\]}])
+    """, re.VERBOSE)
+
+    def __init__(self, document):
+        self.document = document
+        self.line_count = document.blockCount()
+        self.chunks = []                          # temiz chunk'lar, satır sırasında
+        self.dirty = [(0, self.line_count)]       # [start, end) yeniden parse edilecek aralıklar
+        self.last_reparsed = []                   # son parse()'ta yeniden üretilen chunk'lar
+
+    def mark_change(self, position, removed, added):
+        """contentsChange aralığını satır aralığına çevirip işaretle"""
+        document = self.document
+        first = document.findBlock(position).blockNumber()
+        last = document.findBlock(position + added).blockNumber()
+        if last < 0:
+            last = document.blockCount() - 1
+        delta = document.blockCount() - self.line_count
+        self.line_count = document.blockCount()
+
+        # Bir önceki satır da dahil: 'else:' gibi satırlar önceki statement'a eklenir
+        dirty_start = max(0, first - 1)
+        dirty_end = last + 1
+        old_end = dirty_end - delta
+
+        chunks = []
+        for chunk in self.chunks:
+            if chunk.end <= dirty_start:
+                chunks.append(chunk)
+            elif chunk.start >= old_end:
+                chunk.start += delta
+                chunk.end += delta
+                chunks.append(chunk)
+            else:
+                # Değişiklikle kesişen chunk kirli aralığa katılır
+                dirty_start = min(dirty_start, chunk.start)
+                dirty_end = max(dirty_end, chunk.end + delta)
+        self.chunks = chunks
+
+        ranges = []
+        for start, end in self.dirty:
+            if end <= dirty_start:
+                ranges.append((start, end))
+            elif start >= old_end:
+                ranges.append((start + delta, end + delta))
+            else:
+                dirty_start = min(dirty_start, start)
+                dirty_end = max(dirty_end, end + delta)
+        ranges.append((dirty_start, min(dirty_end, self.line_count)))
+        self.dirty = sorted(ranges)
+
+    def parse(self):
+        """Kirli aralıkları parse et; (imports, yeniden parse edilen, toplam chunk) döner"""
+        self.last_reparsed = []
+        if self.dirty:
+            # Yalnızca kesişen/bitişik aralıklar birleşir; aradaki temiz chunk'lara dokunulmaz
+            ranges = []
+            for start, end in sorted(self.dirty):
+                if ranges and start <= ranges[-1][1]:
+                    ranges[-1][1] = max(ranges[-1][1], end)
+                else:
+                    ranges.append([start, end])
+            self.dirty = []
+            self.chunks = [chunk for chunk in self.chunks
+                           if not any(chunk.start < end and chunk.end > start for start, end in ranges)]
+            parsed_end = 0
+            for start, end in ranges:
+                if end <= parsed_end:
+                    continue  # Önceki aralığın statement'ı bu aralığı da yuttu
+                new_chunks = self._parse_range(max(start, parsed_end), end)
+                if new_chunks:
+                    parsed_end = new_chunks[-1].end
+                self.last_reparsed.extend(new_chunks)
+            self.chunks.extend(self.last_reparsed)
+            self.chunks.sort(key=lambda chunk: chunk.start)
+        reparsed = len(self.last_reparsed)
+
+        imports = set()
+        for chunk in self.chunks:
+            imports |= chunk.imports
+        return imports, reparsed, len(self.chunks)
+
+    def invalidate(self):
+        """Tüm dokümanı yeniden parse edilecek olarak işaretle"""
+        self.chunks = []
+        self.line_count = self.document.blockCount()
+        self.dirty = [(0, self.line_count)]
+
+    def symbols(self):
+        names = set()
+        for chunk in self.chunks:
+            names |= chunk.symbols
+        return names
+
+    def variables(self):
+        """Doküman genelinde module seviyesinde atanan değişkenler"""
+        names = set()
+        for chunk in self.chunks:
+            names |= chunk.variables
+        return names
+
+    def _parse_range(self, start, end):
+        """[start, end) satırlarını statement'lara böl; gerekirse sonraki temiz chunk'ları da yut"""
+        next_clean = {chunk.start: chunk for chunk in self.chunks if chunk.start >= end}
+        parsed = []
+        lines = []
+        chunk_start = start
+        only_decorators = False
+
+        block = self.document.findBlockByNumber(start)
+        line = start
+        # Aralık bir statement başında başlar: string/parantez dışında
+        in_string, depth, continued = 0, 0, False
+        while block.isValid():
+            text = block.text()
+            starts = line > chunk_start and not only_decorators and self._starts_statement(
+                text, in_string, depth, continued)
+            if line in next_clean:
+                if starts:
+                    break
+                # Sonraki temiz chunk artık bu statement'ın devamı
+                self.chunks.remove(next_clean.pop(line))
+            if starts:
+                parsed.append(self._parse_chunk(chunk_start, line, lines))
+                chunk_start, lines = line, []
+
+            in_string, depth = self._line_state(text, in_string, depth)
+            continued = text.endswith('\\')
+            if not lines:
+                only_decorators = text.startswith('@')
+            elif only_decorators and text.strip() and not text.lstrip().startswith('#'):
+                only_decorators = text.startswith('@')
+            lines.append(text)
+            block = block.next()
+            line += 1
+
+        if lines:
+            parsed.append(self._parse_chunk(chunk_start, line, lines))
+        return parsed
+
+    @classmethod
+    def _line_state(cls, text, in_string, depth):
+        """Satır sonundaki (açık triple-quote, parantez derinliği); Pide.highlightBlock ile aynı kurallar"""
+        pos = 0
+        if in_string:
+            close = text.find(Pide.TRIPLE_DELIMITERS[in_string])
+            if close == -1:
+                return in_string, depth
+            pos = close + 3
+        elif depth and Pide.TOPLEVEL_PATTERN.match(text):
+            depth = 0
+        for match in cls.LEXICAL_PATTERN.finditer(text, pos):
+            kind = match.lastgroup
+            if kind == 'string_open':
+                return (Pide.STATE_TRIPLE_DOUBLE if match.group() == '"""' else Pide.STATE_TRIPLE_SINGLE), depth
+            if kind == 'bracket_open':
+                depth += 1
+            elif kind == 'bracket_close':
+                depth = max(0, depth - 1)
+        return 0, depth
+
+    def _starts_statement(self, text, in_string, depth, continued):
+        """Önceki satırın sonundaki lexical state'e göre text yeni bir statement başlatıyor mu"""
+        if not text or text[0] in ' \t#)]}':
+            return False
+        if in_string or continued:
+            return False
+        if depth and not Pide.TOPLEVEL_PATTERN.match(text):
+            return False
+        first_word = re.match(r'\w*', text).group()
+        return first_word not in self.CONTINUATION_KEYWORDS
+
+    def _parse_chunk(self, start, end, lines):
+        code = '\n'.join(lines)
+        imports = set()
+        symbols = set()
+        try:
+            tree = ast.parse(code)
+        except (SyntaxError, ValueError):
+            # Yazım sırasında bozuk bölge: import satırlarını yine de yakala
+            for line in lines:
+                imports |= self._imports_from_line(line)
+            return ParsedChunk(start, end, imports, symbols, False)
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports.add(alias.name)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                imports.add(node.module)
+
+        kinds, variables = VariableCollector().collect(tree)
+        positions = {}
+        for (lineno, col), kind in kinds.items():
+            line = lines[lineno - 1]
+            if not line.isascii():
+                # ast sütunları UTF-8 byte offset'i, token'lar karakter index'i
+                col = len(line.encode('utf-8')[:col].decode('utf-8', 'ignore'))
+            positions.setdefault(lineno - 1, {})[col] = kind
+
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                symbols.add(node.name)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    if alias.name != '*':
+                        symbols.add((alias.asname or alias.name).split('.')[0])
+            elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                for target in targets:
+                    for name_node in ast.walk(target):
+                        if isinstance(name_node, ast.Name):
+                            symbols.add(name_node.id)
+        return ParsedChunk(start, end, imports, symbols, True, variables, positions)
+
+    def _imports_from_line(self, line):
+        match = self.IMPORT_LINE.match(line)
+        if not match:
+            return set()
+        if match.group(1):
+            return {match.group(1)}
+        names = set()
+        for part in match.group(2).split(','):
+            words = part.split()
+            if words and re.fullmatch(r'[\w.]+', words[0]):
+                names.add(words[0])
+        return names
+
 
 class Pide(QSyntaxHighlighter):
+    parse_finished = pyqtSignal(float, int, int)  # süre (ms), yeniden parse edilen, toplam statement
+    blocks_highlighted = pyqtSignal()  # take_highlighted_blocks() ile alınacak yeni bloklar var
+
+    KEYWORDS = frozenset([
+        'def', 'class', 'if', 'elif', 'else', 'while', 'for', 'try', 'except',
+        'finally', 'with', 'as', 'import', 'from', 'return', 'break', 'continue',
+        'pass', 'raise', 'yield', 'lambda', 'global', 'nonlocal', 'assert',
+        'del', 'and', 'or', 'not', 'in', 'is', 'True', 'False', 'None'
+    ])
+
+    # Sadece ardından '(' geliyorsa renklendirilir
+    BUILTINS = frozenset([
+        'print', 'len', 'range', 'input', 'int', 'float', 'str', 'list', 'dict',
+        'set', 'tuple', 'open', 'close', 'sum', 'min', 'max', 'sorted', 'reversed',
+        'enumerate', 'map', 'filter', 'zip', 'abs', 'round', 'pow', 'help', 'dir',
+        'isinstance', 'issubclass', 'getattr', 'setattr', 'hasattr', 'type'
+    ])
+
+    # Blok state'i: alt 2 bit açık triple-quote türü, kalan bitler parantez derinliği.
+    # Normal durum -1 olarak saklanır; böylece state taşımayan bloklar Qt'nin
+    # varsayılanıyla aynı kalır ve düzenleme sadece state değiştikçe ileriye yayılır.
+    STATE_TRIPLE_SINGLE = 1
+    STATE_TRIPLE_DOUBLE = 2
+    STATE_STRING_MASK = 0b11
+    STATE_DEPTH_SHIFT = 2
+    MAX_BRACKET_DEPTH = 0xFF
+    # Parantez içinde olamayacak sütun-0 başlıkları: kapanmamış parantezin derinliği
+    # burada sıfırlanır, böylece tek bir açık '(' state'i dosya sonuna kadar taşımaz
+    TOPLEVEL_PATTERN = re.compile(r'(?:async\s+def|def|class|import)\b|@\w')
+
+    TRIPLE_DELIMITERS = {STATE_TRIPLE_SINGLE: "'''", STATE_TRIPLE_DOUBLE: '"""'}
+    MODULE_CALL_PATTERN = re.compile(r'\b(\w+)\.(\w+)\s*(?=\()')
+
+    # Lazy highlighting'de her idle diliminin süre bütçesi
+    LAZY_SLICE_MS = 10
+
     def __init__(self, document):
         super().__init__(document)
 
         # Cache
-        self.imported_modules = {}
         self.failed_modules = set()
         self.modules_name = set()
+        self.pending_modules = set()
+        self.acquired_modules = set()
+
+        # Attribute isimleri tüm tab'lar arasında paylaşılır
+        self.registry = SymbolRegistry.instance()
+        self.registry.changed.connect(self._on_module_resolved)
 
         # Color formats
         self._setup_formats()
         self._setup_highlighting_rules()
 
+        # Module isimleri için derlenmiş tek regex; sadece setler değişince yeniden kurulur
+        self.module_formats = {}
+        self.module_pattern = None
+        self._changed_modules = set()
+        self._invalidate_timer = QTimer(self)
+        self._invalidate_timer.setSingleShot(True)
+        self._invalidate_timer.timeout.connect(self._invalidate_changed_modules)
+
+        # İsim -> o ismi içeren blokların BlockData'ları
+        self.name_index = {}
+
+        # Parser'ın bulduğu module seviyesi değişkenler (MODULE_REFERENCE kontrolü)
+        self.module_variables = set()
+
+        # Son bildirimden beri highlight edilen bloklar (minimap renkleri için);
+        # bildirim olay döngüsü başına bir kez yapılır
+        self.highlighted_blocks = set()
+        self._highlighted_timer = QTimer(self)
+        self._highlighted_timer.setSingleShot(True)
+        self._highlighted_timer.timeout.connect(self.blocks_highlighted.emit)
+
+        # Import'lar için artımlı parser; değişen aralıkları contentsChange'ten alır
+        self.parser = IncrementalParser(document)
+        self.last_parse_stats = (0.0, 0, 0)
+        document.contentsChange.connect(self.parser.mark_change)
+
+        # Lazy highlighting: highlight edilmemiş bloklar boşta dilimler halinde işlenir
+        self.deferred = False
+        self._lazy_next = 0
+        self._lazy_timer = QTimer(self)
+        self._lazy_timer.timeout.connect(self._lazy_fill_step)
+
     def _setup_formats(self):
         def format_template(color, bold=False, italic=False):
             fmt = QTextCharFormat()
@@ -54,120 +1226,609 @@ class Pide(QSyntaxHighlighter):
         self.variable_format_usage     = format_template((156, 120, 255))
 
     def _setup_highlighting_rules(self):
-        self.highlighting_rules = []
-
-        # Keywords
-        keywords = [
-            'def', 'class', 'if', 'elif', 'else', 'while', 'for', 'try', 'except',
-            'finally', 'with', 'as', 'import', 'from', 'return', 'break', 'continue',
-            'pass', 'raise', 'yield', 'lambda', 'global', 'nonlocal', 'assert',
-            'del', 'and', 'or', 'not', 'in', 'is', 'True', 'False', 'None'
-        ]
-        for word in keywords:
-            pattern = QRegExp(rf'\b{word}\b')
-            self.highlighting_rules.append((pattern, self.keyword_format))
-
-        # Built-in functions
-        builtins = [
-            'print', 'len', 'range', 'input', 'int', 'float', 'str', 'list', 'dict', 
-            'set', 'tuple', 'open', 'close', 'sum', 'min', 'max', 'sorted', 'reversed', 
-            'enumerate', 'map', 'filter', 'zip', 'abs', 'round', 'pow', 'help', 'dir', 
-            'isinstance', 'issubclass', 'getattr', 'setattr', 'hasattr', 'type'
-        ]
-        for func in builtins:
-            pattern = QRegExp(rf'\b{func}\b(?=\()')
-            self.highlighting_rules.append((pattern, self.function_format_success))
+        # Tek geçişlik tokenizer: her satır tek bir alternation ile taranır,
+        # keyword/builtin ayrımı set lookup ile yapılır
+        self.token_pattern = re.compile(r"""
+            (?P<comment>\#.*)
+          | (?P<string>"{3}.*?"{3}|'{3}.*?'{3}|"(?!"")(?:[^"\\]|\\.)*"|'(?!'')(?:[^'\\]|\\.)*')
+          | (?P<string_open>"{3}|'{3})
+          | (?P<number>\b\d+\.?\d*\b)
+          | (?P<name>\b[^\W\d]\w*)
+          | (?P<bracket_open>[(\[{])
+          | (?P<bracket_close>[)\]}])
+        """, re.VERBOSE)
+
+        self.token_formats = {
+            'comment': self.comment_format,
+            'string': self.string_format,
+            'number': self.number_format,
+        }
+
+    @classmethod
+    def _unpack_state(cls, state):
+        if state < 0:
+            return 0, 0
+        return state & cls.STATE_STRING_MASK, state >> cls.STATE_DEPTH_SHIFT
+
+    @classmethod
+    def _pack_state(cls, in_string, depth):
+        state = in_string | (min(depth, cls.MAX_BRACKET_DEPTH) << cls.STATE_DEPTH_SHIFT)
+        return state if state else -1
+
+    @staticmethod
+    def _utf16_offsets(text):
+        """String index -> UTF-16 konum tablosu (setFormat UTF-16 sayar); BMP dışı karakter yoksa None"""
+        if text.isascii() or len(text.encode('utf-16-le')) == 2 * len(text):
+            return None
+        return list(itertools.accumulate((2 if ord(char) > 0xFFFF else 1 for char in text), initial=0))
+
+    def _format_setter(self, text):
+        """text için setFormat; BMP dışı karakterli satırda konumlar UTF-16'ya çevrilir"""
+        offsets = self._utf16_offsets(text)
+        if offsets is None:
+            return self.setFormat
+
+        def set_format(start, length, fmt):
+            self.setFormat(offsets[start], offsets[start + length] - offsets[start], fmt)
+        return set_format
+
+    def bracket_depth(self, block):
+        """Blok sonunda açık kalan parantez derinliği"""
+        return self._unpack_state(block.userState())[1]
+
+    def highlightBlock(self, text):
+        if self.deferred:
+            # Lazy modda bloklar sonra (önce görünen alan) highlight edilir
+            return
+        in_string, depth = self._unpack_state(self.previousBlockState())
+        if depth and not in_string and self.TOPLEVEL_PATTERN.match(text):
+            depth = 0
+        # Katlı (gizli) blok: sadece state hesaplanır, açılınca yeniden highlight edilir
+        visible = self.currentBlock().isVisible()
+        pos = 0
+        names = set()
+        name_starts = set()  # String/yorum dışındaki isim token'ları: import renkleri yalnızca bunlara
+        data = self._block_data()
+        # Satır son parse'tan beri değiştiyse konumlar geçersiz; parse sonrası yeniden boyanır
+        variables = data.variables if data.variables_text == text else {}
+        set_format = self._format_setter(text)
+
+        # Önceki bloktan devam eden çok satırlı string
+        if in_string:
+            delimiter = self.TRIPLE_DELIMITERS[in_string]
+            close = text.find(delimiter)
+            if close == -1:
+                if visible:
+                    set_format(0, len(text), self.string_format)
+                self.setCurrentBlockState(self._pack_state(in_string, depth))
+                self._index_block(data, names)
+                return
+            pos = close + len(delimiter)
+            if visible:
+                set_format(0, pos, self.string_format)
+            in_string = 0
+
+        for match in self.token_pattern.finditer(text, pos):
+            kind = match.lastgroup
+            start, end = match.span()
+
+            if kind == 'name':
+                word = match.group()
+                if word in self.KEYWORDS:
+                    fmt = self.keyword_format
+                elif word in self.BUILTINS and text.startswith('(', end):
+                    fmt = self.function_format_success
+                else:
+                    names.add(word)
+                    name_starts.add(start)
+                    variable = variables.get(start)
+                    if variable == VariableCollector.DECLARATION:
+                        fmt = self.variable_format_decl
+                    elif variable == VariableCollector.USAGE or (
+                            variable == VariableCollector.MODULE_REFERENCE and word in self.module_variables):
+                        fmt = self.variable_format_usage
+                    else:
+                        continue
+            elif kind == 'bracket_open':
+                depth += 1
+                continue
+            elif kind == 'bracket_close':
+                depth = max(0, depth - 1)
+                continue
+            elif kind == 'string_open':
+                # Satır sonuna kadar string, sonraki bloklara taşınır
+                in_string = self.STATE_TRIPLE_DOUBLE if match.group() == '"""' else self.STATE_TRIPLE_SINGLE
+                if visible:
+                    set_format(start, len(text) - start, self.string_format)
+                break
+            else:
+                fmt = self.token_formats[kind]
 
-        # Numbers
-        self.highlighting_rules.append((QRegExp(r'\b\d+\.?\d*\b'), self.number_format))
+            if visible:
+                set_format(start, end - start, fmt)
 
-        # Strings
-        for pattern in [r'".*?"', r"'.*?'", r'""".*?"""', r"'''.*?'''"]:
-            self.highlighting_rules.append((QRegExp(pattern), self.string_format))
+        self.setCurrentBlockState(self._pack_state(in_string, depth))
+        self._index_block(data, names)
 
-        # Comments
-        self.highlighting_rules.append((QRegExp(r'#.*'), self.comment_format))
+        if visible:
+            self._highlight_imports(text, name_starts, set_format)
 
-    def highlightBlock(self, text):
-        for pattern, fmt in self.highlighting_rules:
-            index = pattern.indexIn(text)
-            while index >= 0:
-                length = pattern.matchedLength()
-                self.setFormat(index, length, fmt)
-                index = pattern.indexIn(text, index + length)
-
-        self._highlight_imports(text)
-        self._highlight_variables(text)
-
-    def _highlight_imports(self, text):
-        for module_set, fmt in [
-            (self.modules_name, self.module_format_success),
-            (self.failed_modules, self.function_format_failure)
-        ]:
-            for name in module_set:
-                pattern = QRegExp(rf'\b{name}\b')
-                index = pattern.indexIn(text)
-                while index >= 0:
-                    length = pattern.matchedLength()
-                    self.setFormat(index, length, fmt)
-                    index = pattern.indexIn(text, index + length)
-
-        self._highlight_module_functions(text)
-
-    def _highlight_module_functions(self, text):
-        pattern = QRegExp(r'\b(\w+)\.(\w+)\s*(?=\()')
-        index = pattern.indexIn(text)
-
-        while index >= 0:
-            module_name = pattern.cap(1)
-            func_name = pattern.cap(2)
-            pos = pattern.pos(2)
+    def _block_data(self):
+        data = self.currentBlockUserData()
+        if data is None:
+            data = BlockData(self.currentBlock())
+            self.setCurrentBlockUserData(data)
+        else:
+            # Blok bölünüp birleşince veri komşu bloğa geçebilir
+            data.block = self.currentBlock()
+        return data
+
+    def _index_block(self, data, names):
+        """Bloğun içerdiği isimleri name_index'e işle"""
+        self.highlighted_blocks.add(data)
+        if not self._highlighted_timer.isActive():
+            self._highlighted_timer.start(0)
+        if names == data.names:
+            return
 
+        for name in data.names - names:
+            blocks = self.name_index.get(name)
+            if blocks is not None:
+                blocks.discard(data)
+                if not blocks:
+                    del self.name_index[name]
+        for name in names - data.names:
+            self.name_index.setdefault(name, set()).add(data)
+        data.names = frozenset(names)
+
+    def blocks_referencing(self, names):
+        """Verilen isimlerden birini içeren (hala var olan) bloklar"""
+        found = []
+        seen = set()
+        for name in names:
+            blocks = self.name_index.get(name)
+            if not blocks:
+                continue
+            for data in list(blocks):
+                if sip.isdeleted(data):
+                    # Blok silinmiş, index'ten temizle
+                    blocks.discard(data)
+                elif data not in seen:
+                    seen.add(data)
+                    found.append(data.block)
+            if not blocks:
+                del self.name_index[name]
+        return found
+
+    def take_highlighted_blocks(self):
+        """Son çağrıdan beri highlight edilmiş (hala var olan) blokları döndür"""
+        datas, self.highlighted_blocks = self.highlighted_blocks, set()
+        return [data.block for data in datas if not sip.isdeleted(data)]
+
+    def _highlight_imports(self, text, name_starts, set_format):
+        """Module isimlerini ve module.fonksiyon( çağrılarını boya.
+
+        Yalnızca name_index'e giren token'lar (string/yorum dışı) boyanır; böylece
+        import değişince blocks_referencing ile bulunan bloklar renkleri tazelemeye yeter.
+        """
+        if self.module_pattern is not None:
+            for match in self.module_pattern.finditer(text):
+                start, end = match.span()
+                if start in name_starts:
+                    set_format(start, end - start, self.module_formats[match.group()])
+
+        self._highlight_module_functions(text, name_starts, set_format)
+
+    @staticmethod
+    def _names_pattern(names):
+        # Uzun isimler önce: 'os.path' 'os'tan önce denenmeli
+        alternation = '|'.join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+        return re.compile(rf'\b(?:{alternation})\b')
+
+    def _module_status_changed(self, module_name):
+        """Module setleri değişti: matcher'ı yenile, ilgili blokları sonra boya"""
+        self.module_formats = {name: self.module_format_success for name in self.modules_name}
+        self.module_formats.update((name, self.function_format_failure) for name in self.failed_modules)
+        self.module_pattern = self._names_pattern(self.module_formats) if self.module_formats else None
+
+        self._changed_modules.add(module_name)
+        self._invalidate_timer.start(0)
+
+    def _invalidate_changed_modules(self):
+        """Sadece değişen module isimlerini içeren blokları yeniden highlight et"""
+        names, self._changed_modules = self._changed_modules, set()
+        if not names or self.document() is None:
+            return
+        # 'os.path' gibi isimler blokta 'os' token'ı olarak index'lenir
+        heads = {name.split('.', 1)[0] for name in names}
+        for block in self.blocks_referencing(heads):
+            self.rehighlightBlock(block)
+
+    def _highlight_module_functions(self, text, name_starts, set_format):
+        for match in self.MODULE_CALL_PATTERN.finditer(text):
+            if match.start(1) not in name_starts:
+                continue
+            module_name, func_name = match.groups()
+
+            symbols = self.registry.symbols(module_name) if module_name in self.modules_name else None
             fmt = self.function_format_success if (
-                module_name in self.imported_modules and
-                hasattr(self.imported_modules[module_name], func_name)
+                symbols is not None and func_name in symbols
             ) else self.function_format_failure
 
-            self.setFormat(pos, len(func_name), fmt)
-            index = pattern.indexIn(text, index + pattern.matchedLength())
+            set_format(match.start(2), len(func_name), fmt)
+
+    @property
+    def lazy_active(self):
+        return self._lazy_timer.isActive()
+
+    def start_lazy_fill(self):
+        """Highlight edilmemiş blokları baştan sona idle-time dilimlerinde işle"""
+        self._lazy_next = 0
+        self._lazy_timer.start(0)
+
+    def highlight_blocks(self, block, count):
+        """Verilen bloktan itibaren henüz highlight edilmemiş blokları hemen işle"""
+        while block.isValid() and count > 0:
+            if block.userData() is None:
+                self.rehighlightBlock(block)
+            block = block.next()
+            count -= 1
+
+    def _lazy_fill_step(self):
+        document = self.document()
+        if document is None:
+            self._lazy_timer.stop()
+            return
+
+        deadline = time.perf_counter() + self.LAZY_SLICE_MS / 1000
+        block = document.findBlockByNumber(self._lazy_next)
+        while block.isValid() and time.perf_counter() < deadline:
+            if block.userData() is None:
+                self.rehighlightBlock(block)
+            block = block.next()
+            self._lazy_next += 1
+
+        if not block.isValid():
+            self._lazy_timer.stop()
+            # Parse'ta henüz highlight edilmemiş bloklar değişken konumlarını şimdi alır
+            self.parse_full_document()
+            self._apply_variables(self.parser.chunks)
 
     def parse_full_document(self):
-        """Tüm dokümanı tek seferde parse et (her satır için değil)"""
-        code = self.document().toPlainText()
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        self._load_module(alias.name)
-                elif isinstance(node, ast.ImportFrom) and node.module:
-                    self._load_module(node.module)
-        except:
-            pass
+        """Dokümanı parse et - sadece değişen top-level statement'lar yeniden parse edilir"""
+        start = time.perf_counter()
+        imported, reparsed, total = self.parser.parse()
+        self._sync_modules(imported)
+        self._apply_variables(self.parser.last_reparsed)
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self.last_parse_stats = (elapsed, reparsed, total)
+        self.parse_finished.emit(elapsed, reparsed, total)
+
+    def _apply_variables(self, chunks):
+        """Yeniden parse edilen chunk'ların değişken konumlarını bloklara dağıt, değişenleri boya"""
+        document = self.document()
+        if document is None:
+            return
+        changed = []
+        for chunk in chunks:
+            block = document.findBlockByNumber(chunk.start)
+            for offset in range(chunk.end - chunk.start):
+                if not block.isValid():
+                    break
+                data = block.userData()
+                # Henüz highlight edilmemiş bloklar lazy fill sonundaki parse'ta alınır
+                if data is not None:
+                    text = block.text()
+                    variables = chunk.positions.get(offset, {})
+                    current = data.variables if data.variables_text == text else {}
+                    data.variables, data.variables_text = variables, text
+                    if variables != current:
+                        changed.append(block)
+                block = block.next()
+
+        # Module değişken seti değiştiyse o isimleri kullanan bloklar da etkilenir
+        module_variables = self.parser.variables()
+        affected = module_variables ^ self.module_variables
+        self.module_variables = module_variables
+        if affected:
+            changed.extend(self.blocks_referencing(affected))
+
+        for block in changed:
+            self.rehighlightBlock(block)
+
+    def _sync_modules(self, imported):
+        """Artık import edilmeyen module'leri bırak, yenilerini registry'den iste"""
+        for module_name in self.acquired_modules - imported:
+            self._unload_module(module_name)
+        for module_name in imported - self.acquired_modules:
+            self._load_module(module_name)
+        for module_name in self.failed_modules & imported:
+            self.registry.retry(module_name)
 
     def _load_module(self, module_name):
-        if module_name in self.imported_modules or module_name in self.failed_modules:
-            return
-        try:
-            module = importlib.import_module(module_name)
-            self.imported_modules[module_name] = module
-            self.modules_name.add(module_name)
-        except ImportError:
+        self.acquired_modules.add(module_name)
+        found, names = self.registry.acquire(module_name)
+        if found:
+            self._apply_module(module_name, names)
+        else:
+            self.pending_modules.add(module_name)
+
+    def _unload_module(self, module_name):
+        self.acquired_modules.discard(module_name)
+        self.pending_modules.discard(module_name)
+        if module_name in self.modules_name or module_name in self.failed_modules:
+            self.modules_name.discard(module_name)
+            self.failed_modules.discard(module_name)
+            self._module_status_changed(module_name)
+        self.registry.release(module_name)
+
+    def release_modules(self):
+        """Editör kapanırken tüm registry referanslarını bırak"""
+        for module_name in list(self.acquired_modules):
+            self._unload_module(module_name)
+
+    def _on_module_resolved(self, module_name, names):
+        """Arka plan çözümlemesi bitince (GUI thread'inde) çağrılır"""
+        if module_name in self.pending_modules:
+            self.pending_modules.discard(module_name)
+            self._apply_module(module_name, names)
+        elif names is not None and module_name in self.failed_modules:
+            # Başka bir editörün yeniden denemesi başarılı oldu
+            self.failed_modules.discard(module_name)
+            self._apply_module(module_name, names)
+
+    def _apply_module(self, module_name, names):
+        if names is None:
             self.failed_modules.add(module_name)
+        else:
+            self.modules_name.add(module_name)
+        self._module_status_changed(module_name)
+
+class PaintStats:
+    """Bir widget'ın saniyedeki paint sayısı ve paint süreleri"""
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.started = time.perf_counter()
+        self.frames = 0
+        self.total = 0.0
+        self.worst = 0.0
+
+    def record(self, elapsed):
+        self.frames += 1
+        self.total += elapsed
+        self.worst = max(self.worst, elapsed)
+
+    def summary(self):
+        """(fps, ortalama ms, en kötü ms)"""
+        duration = max(time.perf_counter() - self.started, 1e-9)
+        average = self.total / self.frames if self.frames else 0.0
+        return self.frames / duration, average * 1000, self.worst * 1000
+
+
+class RepaintCoalescer(QObject):
+    """Widget update isteklerini kare başına (~16 ms) en fazla bir repaint'e indirger"""
+    FRAME_MS = 16
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = {}  # widget -> QRect (None: tüm widget)
+        self._last_frame = 0.0
+        self.requests = 0
+        self.frames = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._flush)
+
+    def request(self, widget, rect=None):
+        """widget.update(rect) isteğini sıradaki kareye ekle"""
+        self.requests += 1
+        if widget in self._pending:
+            pending = self._pending[widget]
+            if pending is not None:
+                self._pending[widget] = None if rect is None else pending.united(rect)
+        else:
+            self._pending[widget] = rect
+        if not self._timer.isActive():
+            # Boştayken hemen, art arda isteklerde kare süresi dolunca
+            since = (time.perf_counter() - self._last_frame) * 1000
+            self._timer.start(max(0, int(self.FRAME_MS - since)))
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        self._last_frame = time.perf_counter()
+        self.frames += 1
+        for widget, rect in pending.items():
+            if rect is None:
+                widget.update()
+            else:
+                widget.update(rect)
+
+
+class FoldIndex(QObject):
+    """Girinti tabanlı katlama bölgeleri.
+
+    Satır başına girinti dizisi contentsChange ile artımlı güncellenir; bir satır,
+    sonraki dolu satır daha içerideyse bölge başlangıcıdır. Katlı bölgeler
+    başlangıç -> bitiş (hariç) olarak tutulur ve düzenlemelerle kaydırılır.
+    """
+    BLANK = -1  # Boş/yorum satırı: bölgeyi ne başlatır ne bitirir
+
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.code_editor = editor
+        self._indents = None  # İlk kullanımda kurulur
+        self.folded = {}  # başlangıç satırı -> bitiş satırı (hariç)
+        editor.document().contentsChange.connect(self._on_contents_change)
+
+    def _indent(self, text):
+        stripped = text.lstrip()
+        if not stripped or stripped.startswith('#'):
+            return self.BLANK
+        return len(text.expandtabs(self.code_editor.INDENT_SIZE)) - len(stripped.expandtabs(self.code_editor.INDENT_SIZE))
+
+    def _ensure_indents(self):
+        if self._indents is None:
+            doc = self.code_editor.document()
+            indents = []
+            block = doc.begin()
+            while block.isValid():
+                indents.append(self._indent(block.text()))
+                block = block.next()
+            self._indents = array('h', indents)
+        return self._indents
+
+    def _on_contents_change(self, position, removed, added):
+        """Değişen satırların girintisini güncelle (katlama yalnızca dizi kurulduktan sonra olur)"""
+        if self._indents is None:
+            return
+        doc = self.code_editor.document()
+        total_lines = doc.blockCount()
+        first = doc.findBlock(position).blockNumber()
+        last = doc.findBlock(position + added).blockNumber()
+        if last < 0:
+            last = total_lines - 1
+        delta = total_lines - len(self._indents)
+        block = doc.findBlockByNumber(first)
+        indents = []
+        for _ in range(last - first + 1):
+            indents.append(self._indent(block.text()))
+            block = block.next()
+        self._indents[first:last - delta + 1] = array('h', indents)
+
+        if self.folded:
+            self._shift_folds(first, last, delta)
+
+    def _shift_folds(self, first, last, delta):
+        """Düzenleme sonrası katlı bölgeleri kaydır; gizli satırlara dokunanları aç"""
+        old_last = last - delta
+        folded = {}
+        touched = []
+        for start, end in self.folded.items():
+            if end <= first:
+                folded[start] = end
+            elif start > old_last:
+                folded[start + delta] = end + delta
+            elif start == first == old_last and not delta:
+                # Sadece başlık satırı düzenlendi
+                folded[start] = end
+            else:
+                touched.append((start, max(start + 1, end + delta)))
+        self.folded = folded
+        for start, end in touched:
+            self._set_visible(start + 1, end, True)
+
+    def is_fold_start(self, line):
+        """Satırdan sonraki ilk dolu satır daha içerideyse katlanabilir"""
+        indents = self._ensure_indents()
+        base = indents[line] if 0 <= line < len(indents) else self.BLANK
+        if base == self.BLANK:
+            return False
+        for index in range(line + 1, len(indents)):
+            if indents[index] != self.BLANK:
+                return indents[index] > base
+        return False
+
+    def region_end(self, line):
+        """Bölgenin bitişi (hariç): içeride kalan son dolu satırdan sonrası"""
+        indents = self._ensure_indents()
+        base = indents[line]
+        end = line + 1
+        for index in range(line + 1, len(indents)):
+            indent = indents[index]
+            if indent == self.BLANK:
+                continue
+            if indent <= base:
+                break
+            end = index + 1
+        return end
+
+    def is_folded(self, line):
+        return line in self.folded
+
+    def toggle(self, line):
+        if line in self.folded:
+            self.unfold(line)
+        else:
+            self.fold(line)
+
+    def fold(self, line):
+        if not self.is_fold_start(line):
+            return
+        end = self.region_end(line)
+        if end <= line + 1:
+            return
+        self.folded[line] = end
+        self._set_visible(line + 1, end, False)
+
+        # Cursor gizlenen satırlardaysa başlık satırının sonuna al
+        cursor = self.code_editor.textCursor()
+        if line < cursor.blockNumber() < end:
+            block = self.code_editor.document().findBlockByNumber(line)
+            cursor.setPosition(block.position() + block.length() - 1)
+            self.code_editor.setTextCursor(cursor)
+
+    def unfold(self, line):
+        end = self.folded.pop(line, None)
+        if end is not None:
+            self._set_visible(line + 1, end, True)
+
+    def unfold_all(self):
+        for line in sorted(self.folded):
+            self.unfold(line)
+
+    def reveal(self, line):
+        """Satırı içeren tüm katlı bölgeleri aç (arama, hata satırı, minimap ile atlama)"""
+        for start in sorted(start for start, end in self.folded.items() if start < line < end):
+            self.unfold(start)
+
+    def _set_visible(self, first, end, visible):
+        """[first, end) bloklarını göster/gizle; açılırken iç içe katlı bölgeler kapalı kalır"""
+        editor = self.code_editor
+        doc = editor.document()
+        block = doc.findBlockByNumber(first)
+        if not block.isValid():
+            return
+        start_position = block.position()
+        shown = []
+        line = first
+        while block.isValid() and line < end:
+            block.setVisible(visible)
+            if visible:
+                shown.append(block)
+                nested_end = self.folded.get(line)
+                if nested_end is not None:
+                    # İç bölge katlı kalır: gövdesini atla
+                    while block.isValid() and line + 1 < nested_end:
+                        block = block.next()
+                        line += 1
+            end_position = block.position() + block.length()
+            block = block.next()
+            line += 1
+        doc.markContentsDirty(start_position, end_position - start_position)
+
+        if visible:
+            # Gizliyken formatsız bırakılan bloklar şimdi highlight edilir
+            highlighter = editor.highlighter
+            if highlighter.document() is not None and not highlighter.deferred:
+                for shown_block in shown:
+                    highlighter.rehighlightBlock(shown_block)
+        editor.viewport().update()
+        # Görünürlük revision'ı değiştirmez: gutter'ın yükseklik cache'i elle temizlenir
+        editor.line_number_area.invalidate_heights()
+        editor.line_number_area.update()
 
-    def _highlight_variables(self, text):
-        pattern = QRegExp(r'\b(\w+)\s*=')
-        index = pattern.indexIn(text)
-        while index >= 0:
-            length = len(pattern.cap(1))
-            self.setFormat(index, length, self.variable_format_decl)
-            index = pattern.indexIn(text, index + pattern.matchedLength())
 
 class LineNumberArea(QWidget):
     BACKGROUND_COLOR = QColor(45, 45, 45)
     TEXT_COLOR = QColor(133, 133, 133)
     BORDER_COLOR = QColor(62, 62, 62)
+    MARKER_COLOR = QColor(160, 160, 160)
     PADDING = 5
+    FOLD_MARKER_WIDTH = 12
+    GLYPH_CACHE_LIMIT = 4096
 
     def __init__(self, editor):
         super().__init__(editor)
@@ -179,6 +1840,40 @@ class LineNumberArea(QWidget):
                 border-right: 1px solid {self.BORDER_COLOR.name()};
             }}
         """)
+        self.paint_stats = PaintStats()
+
+        # Satır numarası -> (QStaticText, genişlik); font değişince temizlenir
+        self._glyphs = {}
+        # Blok numarası -> yükseklik; doküman revision'ı veya genişlik değişince temizlenir
+        self._heights = {}
+        self._heights_key = None
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self._glyphs.clear()
+
+    def _glyph(self, number):
+        glyph = self._glyphs.get(number)
+        if glyph is None:
+            if len(self._glyphs) >= self.GLYPH_CACHE_LIMIT:
+                self._glyphs.clear()
+            text = QStaticText(str(number))
+            text.setTextFormat(Qt.PlainText)
+            text.prepare(QTransform(), self.font())
+            glyph = self._glyphs[number] = (text, text.size().width())
+        return glyph
+
+    def invalidate_heights(self):
+        """Blok yükseklikleri revision değişmeden değişti (katlama)"""
+        self._heights.clear()
+        self._heights_key = None
+
+    def _block_height(self, block):
+        height = self._heights.get(block.blockNumber())
+        if height is None:
+            height = self._heights[block.blockNumber()] = self.code_editor.blockBoundingRect(block).height()
+        return height
 
     def sizeHint(self):
         """ Satır numara alanının ideal genişliği. """
@@ -186,30 +1881,77 @@ class LineNumberArea(QWidget):
         return QSize(width, 0)
 
     def paintEvent(self, event):
+        started = time.perf_counter()
+        self._paint(event)
+        self.paint_stats.record(time.perf_counter() - started)
+
+    def _paint(self, event):
         painter = QPainter(self)
         painter.fillRect(event.rect(), self.BACKGROUND_COLOR)
 
-        block = self.code_editor.firstVisibleBlock()
+        editor = self.code_editor
+        heights_key = (editor.document().revision(), editor.blockCount(), editor.viewport().width())
+        if heights_key != self._heights_key:
+            self._heights.clear()
+            self._heights_key = heights_key
+
+        block = editor.firstVisibleBlock()
         block_number = block.blockNumber()
-        top = self.code_editor.blockBoundingGeometry(block).translated(self.code_editor.contentOffset()).top()
-        bottom = top + self.code_editor.blockBoundingRect(block).height()
-        font_height = self.code_editor.fontMetrics().height()
+        top = editor.blockBoundingGeometry(block).translated(editor.contentOffset()).top()
+        bottom = top + self._block_height(block)
         line_width = self.width() - self.PADDING
-
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                line_number = str(block_number + 1)
-                painter.setPen(self.TEXT_COLOR)
-                painter.drawText(0, int(top), line_width, font_height, Qt.AlignRight, line_number)
+        rect_top, rect_bottom = event.rect().top(), event.rect().bottom()
+        folds = editor.folds
+        markers = []
+        painter.setPen(self.TEXT_COLOR)
+
+        while block.isValid() and top <= rect_bottom:
+            if block.isVisible() and bottom >= rect_top:
+                text, width = self._glyph(block_number + 1)
+                painter.drawStaticText(QPointF(line_width - width, int(top)), text)
+                if folds.is_folded(block_number):
+                    markers.append((top, bottom, True))
+                elif folds.is_fold_start(block_number):
+                    markers.append((top, bottom, False))
 
             block = block.next()
             top = bottom
-            bottom = top + self.code_editor.blockBoundingRect(block).height()
+            if block.isValid():
+                bottom = top + self._block_height(block)
             block_number += 1
 
+        if markers:
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.MARKER_COLOR)
+            for top, bottom, folded in markers:
+                painter.drawPolygon(self._marker(top, bottom, folded))
+
+    def _marker(self, top, bottom, folded):
+        """Katlı bölge için ▸, açık bölge için ▾"""
+        size = self.FOLD_MARKER_WIDTH / 2
+        x = float(self.PADDING)
+        y = (top + bottom) / 2 - size / 2
+        if folded:
+            points = [QPointF(x, y), QPointF(x + size, y + size / 2), QPointF(x, y + size)]
+        else:
+            points = [QPointF(x, y), QPointF(x + size, y), QPointF(x + size / 2, y + size)]
+        return QPolygonF(points)
+
+    def mousePressEvent(self, event):
+        """Marker sütununa tıklanınca bölgeyi katla/aç"""
+        if event.x() > self.PADDING + self.FOLD_MARKER_WIDTH:
+            return super().mousePressEvent(event)
+        block = self.code_editor.cursorForPosition(QPoint(0, event.y())).block()
+        self.code_editor.folds.toggle(block.blockNumber())
+
 
 class Minimap(QWidget):
     """Code overview minimap"""
+    BACKGROUND_COLOR = QColor(26, 26, 26)
+    LINE_COLOR = QColor(100, 100, 100)
+    TEXT_COLOR = QColor(180, 180, 180)
+
     def __init__(self, editor):
         super().__init__(editor)
         self.code_editor = editor
@@ -221,10 +1963,232 @@ class Minimap(QWidget):
             }
         """)
         self.setMouseTracking(True)
-    
+        self.detail = True  # Büyük dosyalarda kapatılır, yalnızca görünür alan çizilir
+
+        # Satır uzunlukları (boş satır 0) ve Pide'nin ürettiği renk aralıkları;
+        # çizim blokları değil bu dizileri okur
+        self._lengths = None
+        self._colors = None  # satır başına ((başlangıç, bitiş, rgb), ...) veya None
+        self._pens = {}
+        self.paint_stats = PaintStats()
+        # Önbellek görüntüsü: satır başına line_height piksel, ya da satırlar piksel
+        # satırından fazlaysa (downsampled) piksel satırı başına bir bucket
+        self._image = None
+        self._line_height = 1
+        self._downsampled = False
+        self._rows = None  # downsampled: piksel satırı başına çizilen (en uzun, alfa, renkler)
+        editor.document().contentsChange.connect(self._on_contents_change)
+
+    def _line_height_for(self, total_lines):
+        return max(1, self.height() // max(1, total_lines))
+
+    def _line_at(self, y, total_lines):
+        """Minimap y'sindeki satır (çizimle aynı hesap: downsampled'da satır bucket'ı)"""
+        if total_lines > self.height():
+            return y * total_lines // self.height()
+        return y // self._line_height_for(total_lines)
+
+    def _line_y(self, line, total_lines):
+        """Satırın çizildiği minimap y'si (_line_at'in tersi)"""
+        if total_lines > self.height():
+            return ((line + 1) * self.height() - 1) // total_lines
+        return line * self._line_height_for(total_lines)
+
+    @staticmethod
+    def _line_length(text):
+        return min(len(text), 0xFFFF) if text.strip() else 0
+
+    @staticmethod
+    def _block_colors(block):
+        """Bloğun highlight format'larından renk aralıkları (yeniden lex etmeden)"""
+        runs = []
+        for format_range in block.layout().formats():
+            brush = format_range.format.foreground()
+            if brush.style() != Qt.NoBrush:
+                start = format_range.start
+                runs.append((start, start + format_range.length, brush.color().rgb()))
+        return tuple(runs) or None
+
+    def _rebuild(self):
+        """Önbelleği baştan oluştur (boyut, mod veya satır yüksekliği değişince)"""
+        if self._lengths is None:
+            blocks = list(self._iter_blocks(0))
+            self._lengths = array('H', (self._line_length(block.text()) for block in blocks))
+            self._colors = [self._block_colors(block) for block in blocks]
+        total_lines = len(self._lengths)
+        self._downsampled = total_lines > self.height()
+        self._line_height = self._line_height_for(total_lines)
+        rows = self.height() if self._downsampled else total_lines * self._line_height
+        self._image = QImage(self.width(), max(1, rows), QImage.Format_RGB32)
+        if self._downsampled:
+            self._rows = [False] * self.height()  # Hiçbir özete eşit değil: hepsi çizilir
+            self._render_rows(0, self.height())
+        else:
+            self._render_lines(0, total_lines)
+
+    def _iter_blocks(self, start, count=None):
+        block = self.code_editor.document().findBlockByNumber(start)
+        while block.isValid() and count != 0:
+            yield block
+            block = block.next()
+            if count is not None:
+                count -= 1
+
+    def _on_contents_change(self, position, removed, added):
+        """Değişen satırları önbellekte yeniden çiz, altındaki satırları kaydır"""
+        if self._lengths is None or not self.detail:
+            return
+        doc = self.code_editor.document()
+        total_lines = doc.blockCount()
+        first = doc.findBlock(position).blockNumber()
+        last = doc.findBlock(position + added).blockNumber()
+        if last < 0:
+            last = total_lines - 1
+        delta = total_lines - len(self._lengths)
+        blocks = list(self._iter_blocks(first, last - first + 1))
+        self._lengths[first:last - delta + 1] = array('H', (self._line_length(block.text()) for block in blocks))
+        self._colors[first:last - delta + 1] = [self._block_colors(block) for block in blocks]
+        self._redraw(first, last, delta, total_lines)
+
+    def refresh_colors(self):
+        """Pide'nin yeniden highlight ettiği blokların renklerini güncelle"""
+        blocks = self.code_editor.highlighter.take_highlighted_blocks()
+        if self._colors is None or not self.detail:
+            return
+        changed = []
+        for block in blocks:
+            line_num = block.blockNumber()
+            if 0 <= line_num < len(self._colors):
+                colors = self._block_colors(block)
+                if colors != self._colors[line_num]:
+                    self._colors[line_num] = colors
+                    changed.append(line_num)
+        # Ardışık satırlar tek seferde çizilir
+        changed.sort()
+        start = None
+        for index, line_num in enumerate(changed):
+            if start is None:
+                start = line_num
+            if index + 1 == len(changed) or changed[index + 1] != line_num + 1:
+                self._redraw(start, line_num, 0, len(self._colors))
+                start = None
+
+    def _redraw(self, first, last, delta, total_lines):
+        """[first, last] satırları değişti (delta: satır sayısı farkı); önbelleği güncelle"""
+        if self._image is None:
+            return
+        if (total_lines > self.height()) != self._downsampled or (
+                not self._downsampled and self._line_height_for(total_lines) != self._line_height):
+            self._image = None
+        elif self._downsampled:
+            if delta:
+                # Satır sayısı değişince tüm bucket sınırları kayar: bucket'lar yeniden
+                # özetlenir (O(satır), C seviyesinde), yalnızca özeti değişen satırlar çizilir
+                self._render_rows(0, self.height())
+            else:
+                first_row = max(0, first * self.height() // total_lines - 1)
+                last_row = min(self.height(), last * self.height() // total_lines + 2)
+                self._render_rows(first_row, last_row)
+        else:
+            if delta:
+                self._shift_rows(first, last, delta, total_lines)
+            self._render_lines(first, last + 1)
+        self.code_editor.repaints.request(self)
+
+    def _shift_rows(self, first, last, delta, total_lines):
+        """Satır sayısı değişti: değişen aralığın üstünü ve altını yeni görüntüye kopyala"""
+        line_height = self._line_height
+        old = self._image
+        self._image = QImage(self.width(), max(1, total_lines * line_height), QImage.Format_RGB32)
+        painter = QPainter(self._image)
+        if first:
+            painter.drawImage(0, 0, old, 0, 0, -1, first * line_height)
+        tail = (last - delta + 1) * line_height
+        if tail < old.height():
+            painter.drawImage(0, (last + 1) * line_height, old, 0, tail, -1, -1)
+        painter.end()
+
+    def _render_lines(self, start, end):
+        """[start, end) satırlarını önbellek görüntüsüne çiz"""
+        line_height = self._line_height
+        map_width = self._image.width()
+        painter = QPainter(self._image)
+        painter.fillRect(0, start * line_height, map_width, (end - start) * line_height, self.BACKGROUND_COLOR)
+
+        for line_num in range(start, min(end, len(self._lengths))):
+            length = self._lengths[line_num]
+            if length:
+                # Kod satırı - daha parlak
+                painter.setPen(self.LINE_COLOR)
+                painter.drawLine(0, line_num * line_height, map_width, line_num * line_height)
+                self._draw_code(painter, line_num * line_height, length, self._colors[line_num], map_width)
+        painter.end()
+
+    def _draw_code(self, painter, y, length, colors, map_width):
+        """Satır uzunluğuna göre çizgi; highlight renkleri varsa üstüne renkli parçalar"""
+        scale = map_width / 100.0
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawLine(0, y, int(min(length * scale, map_width)), y)
+        if not colors:
+            return
+        for start, end, rgb in colors:
+            x1 = min(int(end * scale), map_width)
+            x0 = int(start * scale)
+            if x0 >= map_width:
+                break
+            pen = self._pens.get(rgb)
+            if pen is None:
+                pen = self._pens[rgb] = QColor.fromRgb(rgb)
+            painter.setPen(pen)
+            painter.drawLine(x0, y, max(x0, x1 - 1), y)
+
+    def _render_rows(self, start, end):
+        """Downsampled mod: [start, end) piksel satırlarını satır bucket'larından çiz.
+
+        Bucket özetleri (C seviyesinde max/count) her satır için yeniden hesaplanır;
+        yalnızca özeti önceki çizimden farklı olan piksel satırları boyanır.
+        """
+        lengths = self._lengths
+        total_lines = len(lengths)
+        map_height = self.height()
+        map_width = self._image.width()
+        rows = self._rows
+        painter = QPainter(self._image)
+
+        for row in range(start, end):
+            first_line = row * total_lines // map_height
+            bucket = lengths[first_line:(row + 1) * total_lines // map_height]
+            longest = max(bucket) if bucket else 0
+            summary = None
+            if longest:
+                # Dolu satır oranı soluk çizginin parlaklığını, en uzun satır (renkleriyle) parlak çizgiyi belirler
+                alpha = int(255 * (0.4 + 0.6 * (1.0 - bucket.count(0) / len(bucket))))
+                summary = (longest, alpha, self._colors[first_line + bucket.index(longest)])
+            if summary == rows[row]:
+                continue
+            rows[row] = summary
+            painter.fillRect(0, row, map_width, 1, self.BACKGROUND_COLOR)
+            if summary is None:
+                continue
+            line_color = QColor(self.LINE_COLOR)
+            line_color.setAlpha(alpha)
+            painter.setPen(line_color)
+            painter.drawLine(0, row, map_width, row)
+            self._draw_code(painter, row, longest, summary[2], map_width)
+        painter.end()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._image = None
+
     def paintEvent(self, event):
+        started = time.perf_counter()
+        self._paint(event)
+        self.paint_stats.record(time.perf_counter() - started)
+
+    def _paint(self, event):
         painter = QPainter(self)
-        painter.fillRect(self.rect(), QColor(26, 26, 26))
+        painter.fillRect(self.rect(), self.BACKGROUND_COLOR)
         
         doc = self.code_editor.document()
         total_lines = doc.blockCount()
@@ -233,42 +2197,20 @@ class Minimap(QWidget):
             return
         
         # Minimap boyutları
-        map_height = self.height()
         map_width = self.width()
-        line_height = max(1, map_height / total_lines)
-        
-        # Font ayarları
-        font = QFont('Consolas', 2)
-        painter.setFont(font)
-        
-        # Her satırı çiz
-        block = doc.begin()
-        line_num = 0
-        
-        while block.isValid():
-            y = int(line_num * line_height)
-            text = block.text()
-            
-            if text.strip():
-                # Kod satırı - daha parlak
-                painter.setPen(QColor(100, 100, 100))
-                painter.drawLine(0, y, map_width, y)
-                
-                # Satır uzunluğuna göre çizgi uzunluğu
-                rel_length = min(len(text) / 100.0, 1.0)
-                painter.setPen(QColor(180, 180, 180))
-                painter.drawLine(0, y, int(map_width * rel_length), y)
-            
-            block = block.next()
-            line_num += 1
-        
+
+        if self.detail:
+            if self._image is None:
+                self._rebuild()
+            painter.drawImage(0, 0, self._image)
+
         # Visible area göstergesi
         first_visible = self.code_editor.firstVisibleBlock().blockNumber()
         visible_lines = self.code_editor.viewport().height() / self.code_editor.fontMetrics().height()
         last_visible = min(first_visible + int(visible_lines), total_lines)
         
-        visible_start_y = int(first_visible * line_height)
-        visible_height = int((last_visible - first_visible) * line_height)
+        visible_start_y = self._line_y(first_visible, total_lines)
+        visible_height = self._line_y(last_visible, total_lines) - visible_start_y
         
         painter.setPen(Qt.NoPen)
         painter.setBrush(QColor(0, 122, 204, 60))
@@ -283,14 +2225,11 @@ class Minimap(QWidget):
         doc = self.code_editor.document()
         total_lines = doc.blockCount()
         
-        click_y = event.y()
-        map_height = self.height()
-        
-        line_num = int((click_y / map_height) * total_lines)
-        line_num = max(0, min(line_num, total_lines - 1))
+        line_num = self._line_at(max(0, event.y()), total_lines)
+        line_num = min(line_num, total_lines - 1)
         
         # O satıra scroll et
-        cursor = QTextCursor(doc.findBlockByLineNumber(line_num))
+        cursor = QTextCursor(doc.findBlockByNumber(line_num))
         self.code_editor.setTextCursor(cursor)
         self.code_editor.centerCursor()
     
@@ -299,14 +2238,620 @@ class Minimap(QWidget):
         self.code_editor.wheelEvent(event)
 
 
+class FileLoader(QObject):
+    """Büyük dosyayı arka planda parça parça okuyup GUI thread'e iletir"""
+    chunk_loaded = pyqtSignal(str)
+    progress = pyqtSignal(int, int)  # okunan byte, toplam byte
+    finished = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    CHUNK_CHARS = 256 * 1024  # ~25 ms insertText, GUI akıcı kalır
+    MAX_PENDING_CHUNKS = 8  # GUI yetişemezse okuma beklesin (bellek sınırı)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.total = os.path.getsize(path)
+        self._cancelled = threading.Event()
+        self._slots = threading.Semaphore(self.MAX_PENDING_CHUNKS)
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def cancel(self):
+        self._cancelled.set()
+        self._slots.release()
+
+    def chunk_consumed(self):
+        """GUI bir parçayı editöre ekledi, okuyucu devam edebilir"""
+        self._slots.release()
+
+    def _run(self):
+        try:
+            # Text mode: UTF-8 çözümü ve \r\n dönüşümü parça sınırlarında da doğru kalır
+            with open(self.path, 'r', encoding='utf-8') as file:
+                while not self._cancelled.is_set():
+                    chunk = file.read(self.CHUNK_CHARS)
+                    if not chunk:
+                        break
+                    self._slots.acquire()
+                    if self._cancelled.is_set():
+                        return
+                    self.chunk_loaded.emit(chunk)
+                    self.progress.emit(file.buffer.tell(), self.total)
+        except Exception as e:
+            if not self._cancelled.is_set():
+                self.failed.emit(str(e))
+            return
+        if not self._cancelled.is_set():
+            self.finished.emit()
+
+
+class MatchIndexer(QObject):
+    """Arama eşleşmelerini arka planda bulur; yeni sorgu eskisini iptal eder (generation)"""
+    finished = pyqtSignal(int, object, object)  # generation, başlangıçlar, bitişler (QTextDocument konumu)
+
+    # BMP dışı karakterler QTextDocument'te iki UTF-16 birimi tutar
+    WIDE_CHAR = re.compile('[\U00010000-\U0010FFFF]')
+    CHECK_EVERY = 4096  # Bu kadar eşleşmede bir iptal kontrolü
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+
+    def start(self, pattern, text):
+        """text üzerinde pattern eşleşmelerini ara; dönen generation sonucu eşler"""
+        self.generation += 1
+        threading.Thread(target=self._run, args=(pattern, text, self.generation), daemon=True).start()
+        return self.generation
+
+    def cancel(self):
+        self.generation += 1
+
+    def _run(self, pattern, text, generation):
+        wide = [match.start() for match in self.WIDE_CHAR.finditer(text)]
+        starts = array('l')
+        ends = array('l')
+        try:
+            for count, match in enumerate(pattern.finditer(text)):
+                if count % self.CHECK_EVERY == 0 and generation != self.generation:
+                    return
+                start, end = match.span()
+                if wide:
+                    start += bisect.bisect_left(wide, start)
+                    end += bisect.bisect_left(wide, end)
+                starts.append(start)
+                ends.append(end)
+        except Exception as e:
+            print(f"Match indexer error: {e}")
+            return
+        if generation == self.generation:
+            self.finished.emit(generation, starts, ends)
+
+
+class TrigramIndex(QObject):
+    """Proje dosyalarının trigram imzaları; Find in Files yalnızca aday dosyaları açar.
+
+    Her dosyanın kelime (\w) dizilerindeki küçük harf trigram'ları dosya başına bir bit
+    imzasına (bloom filter) yazılır. Sorgunun literal kısımlarındaki trigram'lardan biri
+    imzada yoksa dosya okunmadan elenir. İmzalar (mtime, boyut) ile diskte saklanır;
+    klasör değişikliklerinde ve kayıtlarda yalnızca değişen dosyalar yeniden okunur.
+    """
+    INDEX_DIR = os.path.join(CACHE_DIR, 'trigram_index')
+    WORD = re.compile(rb'\w{3,}')           # bytes regex: yalnızca ASCII [A-Za-z0-9_]
+    QUERY_WORD = re.compile(r'[A-Za-z0-9_]{3,}')
+    # re.IGNORECASE'de ASCII dışı karakterlerle de eşleşen harfler (İ ı K ſ)
+    UNICODE_FOLDS = frozenset(b'iks')
+    MIN_BITS = 256
+    BITS_PER_TRIGRAM = 4      # İmza ~%22 dolu: 3 trigram'lık sorguda ~%1 yanlış aday
+    MAX_ALTERNATIVES = 16     # Regex alternation açılımı bundan büyükse kısıt düşürülür
+    REPEATS = tuple(op for op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+                                  getattr(sre_constants, 'POSSESSIVE_REPEAT', None)) if op is not None)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.root = None
+        self.files = {}  # yol -> (mtime_ns, boyut, bit sayısı, imza); aranmayan dosyada imza None
+        self._generation = 0
+        self._lock = threading.Lock()  # Tarama ve güncellemeler sırayla çalışır
+
+    def cache_file(self, root):
+        digest = hashlib.sha1(os.path.abspath(root).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.INDEX_DIR, digest + '.json')
+
+    def index(self, root):
+        """root altını arka planda tara (thread döner); cache'e göre yalnızca değişen dosyalar okunur"""
+        if root != self.root:
+            self.root = root
+            self.files = {}
+        self._generation += 1
+        thread = threading.Thread(target=self._run, args=(root, [root], self._generation, True), daemon=True)
+        thread.start()
+        return thread
+
+    def update(self, paths):
+        """Değişen klasörleri (alt klasörleriyle) veya dosyaları arka planda yeniden indexle"""
+        if self.root is not None and paths:
+            threading.Thread(target=self._run, args=(self.root, list(paths), self._generation, False),
+                             daemon=True).start()
+
+    @staticmethod
+    def _bit(gram, bits):
+        # Fibonacci hashing: çarpımın üst bitleri trigram'ın üç baytına da bağlı
+        return (int.from_bytes(gram, 'little') * 0x9E3779B97F4A7C15 & 0xFFFFFFFFFFFFFFFF) >> (65 - bits.bit_length())
+
+    @classmethod
+    def signature(cls, data):
+        """Dosya içeriğinin imzası: (bit sayısı, imza); binary/çok büyük dosyada (0, None)"""
+        if data is None:
+            return 0, None
+        grams = {word[i:i + 3] for word in set(cls.WORD.findall(data.lower())) for i in range(len(word) - 2)}
+        bits = cls.MIN_BITS
+        while bits < len(grams) * cls.BITS_PER_TRIGRAM:
+            bits *= 2
+        signature = bytearray(bits // 8)
+        for bit in {cls._bit(gram, bits) for gram in grams}:
+            signature[bit >> 3] |= 1 << (bit & 7)
+        return bits, int.from_bytes(signature, 'little')
+
+    @staticmethod
+    def stamp(path):
+        info = os.stat(path)
+        return info.st_mtime_ns, info.st_size
+
+    def _refresh(self, path, cached):
+        """Dosya değiştiyse imzasını yeniden hesapla; değiştiyse True"""
+        try:
+            stamp = self.stamp(path)
+        except OSError:
+            return self.files.pop(path, None) is not None
+        entry = self.files.get(path) or cached.get(path)
+        if entry is None or entry[:2] != stamp:
+            entry = stamp + self.signature(ProjectSearch.read_bytes(path))
+            self.files[path] = entry
+            return True
+        if path not in self.files:
+            self.files[path] = entry
+        return False
+
+    def _load(self, root):
+        try:
+            with open(self.cache_file(root), 'r', encoding='utf-8') as f:
+                cached = json.load(f).get('files', {})
+            return {path: (mtime, size, bits, int(signature, 16) if bits else None)
+                    for path, (mtime, size, bits, signature) in cached.items()}
+        except (OSError, ValueError, AttributeError, TypeError):
+            return {}
+
+    def _save(self, root):
+        files = {path: [mtime, size, bits, format(signature, 'x') if bits else '']
+                 for path, (mtime, size, bits, signature) in dict(self.files).items()}
+        _write_json_atomic(self.cache_file(root), {'root': root, 'files': files})
+
+    def _run(self, root, paths, generation, full):
+        with self._lock:
+            cached = self._load(root) if full and not self.files else {}
+            prefix = os.path.join(os.path.abspath(root), '')
+            changed = False
+            for path in paths:
+                if generation != self._generation or root != self.root:
+                    return
+                if not os.path.join(os.path.abspath(path), '').startswith(prefix):
+                    continue
+                if not os.path.isdir(path):
+                    changed |= self._refresh(path, cached)
+                    continue
+                seen = set()
+                for file_path in ProjectSearch.iter_files(path):
+                    if generation != self._generation:
+                        return
+                    seen.add(file_path)
+                    changed |= self._refresh(file_path, cached)
+                # Klasörden silinen dosyalar
+                folder = os.path.join(path, '')
+                for file_path in [p for p in self.files if p.startswith(folder) and p not in seen]:
+                    del self.files[file_path]
+                    changed = True
+            if changed or (full and len(cached) != len(self.files)):
+                self._save(root)
+
+    def snapshot(self):
+        return dict(self.files)
+
+    @classmethod
+    def trigrams(cls, text, ignorecase=False):
+        grams = set()
+        for word in cls.QUERY_WORD.findall(text):
+            word = word.lower().encode('ascii')
+            grams.update(word[i:i + 3] for i in range(len(word) - 2))
+        if ignorecase:
+            grams = {gram for gram in grams if cls.UNICODE_FOLDS.isdisjoint(gram)}
+        return frozenset(grams)
+
+    @classmethod
+    def query_trigrams(cls, pattern):
+        """Her eşleşmede bulunması gereken trigram kümeleri (alternatiflerden biri yeterli).
+
+        Regex'ten literal kısımlar çıkarılır; kısıt bulunamazsa None (tüm dosyalar aranır).
+        """
+        try:
+            parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+        except Exception:
+            return None
+        alternatives = cls._required(parsed, bool(parsed.state.flags & re.IGNORECASE))
+        if any(not grams for grams in alternatives):
+            return None
+        return alternatives
+
+    @classmethod
+    def _required(cls, items, ignorecase):
+        """Parse ağacındaki zorunlu literal'lerin trigram'ları (DNF: kümelerin listesi)"""
+        result = [frozenset()]
+        run = []
+        for op, av in items:
+            if op is sre_constants.LITERAL and av < 128:
+                run.append(chr(av))
+                continue
+            result = cls._and(result, [cls.trigrams(''.join(run), ignorecase)])
+            run = []
+            if op is sre_constants.SUBPATTERN:
+                _, add_flags, del_flags, sub = av
+                sub_ignorecase = (ignorecase or bool(add_flags & re.IGNORECASE)) and not del_flags & re.IGNORECASE
+                result = cls._and(result, cls._required(sub, sub_ignorecase))
+            elif op in cls.REPEATS and av[0] >= 1:
+                result = cls._and(result, cls._required(av[2], ignorecase))
+            elif op is getattr(sre_constants, 'ATOMIC_GROUP', ()):
+                result = cls._and(result, cls._required(av, ignorecase))
+            elif op is sre_constants.BRANCH:
+                branches = []
+                for branch in av[1]:
+                    branches.extend(cls._required(branch, ignorecase))
+                result = cls._and(result, cls._or(branches))
+        return cls._and(result, [cls.trigrams(''.join(run), ignorecase)])
+
+    @classmethod
+    def _or(cls, alternatives):
+        alternatives = list(set(alternatives))
+        if len(alternatives) > cls.MAX_ALTERNATIVES or any(not grams for grams in alternatives):
+            return [frozenset()]
+        return alternatives
+
+    @classmethod
+    def _and(cls, left, right):
+        if right == [frozenset()]:
+            return left
+        if left == [frozenset()]:
+            return right
+        if len(left) * len(right) > cls.MAX_ALTERNATIVES:
+            return min(left, right, key=len)  # Kısıtın bir kısmını bırakmak sonucu değiştirmez
+        return [a | b for a in left for b in right]
+
+    @classmethod
+    def matcher(cls, pattern):
+        """İmza -> aday mı fonksiyonu; sorgudan trigram çıkmazsa None"""
+        alternatives = cls.query_trigrams(pattern)
+        if alternatives is None:
+            return None
+        masks = {}  # bit sayısı -> alternatif maskeleri
+
+        def accept(entry):
+            bits, signature = entry[2], entry[3]
+            if signature is None:
+                return False
+            bit_masks = masks.get(bits)
+            if bit_masks is None:
+                bit_masks = masks[bits] = [sum(1 << bit for bit in {cls._bit(gram, bits) for gram in grams})
+                                           for grams in alternatives]
+            return any(signature & mask == mask for mask in bit_masks)
+        return accept
+
+    def __len__(self):
+        return len(self.files)
+
+
+class FileReplacement:
+    """Replace in Files için tek dosyada planlanan değişiklik"""
+    def __init__(self, path, old_text, new_text, count, output, stamp):
+        self.path = path
+        self.old_text = old_text    # değişiklikten önceki metin (\n satır sonlu)
+        self.new_text = new_text
+        self.count = count          # değiştirilen eşleşme sayısı
+        self.output = output        # diske yazılacak metin (orijinal satır sonlarıyla)
+        self.stamp = stamp          # okunduğu andaki (mtime_ns, boyut)
+
+
+class ProjectSearch(QObject):
+    """Proje dosyalarında thread havuzu ile arama; eşleşen dosyalar bulundukça iletilir"""
+    file_matched = pyqtSignal(int, str, object)  # generation, yol, [(satır, kolon, uzunluk, metin), ...]
+    finished = pyqtSignal(int, int, int, float)  # generation, taranan dosya, eşleşme, süre (s)
+
+    WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Okuma I/O ağırlıklı
+    MAX_FILE_SIZE = 8 * 1024 * 1024
+    MAX_MATCHES_PER_FILE = 1000
+    MAX_LINE_CHARS = 300  # Sonuç listesinde gösterilen satır uzunluğu
+    BINARY_SNIFF = 8192
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+
+    def start(self, root, pattern, prefilter=None, index=None, verify=True):
+        """root altında aramayı başlat; süren arama iptal edilir.
+
+        prefilter: (byte dizisi, küçük harfe çevir) — eşleşen her dosyada bulunması
+        gereken dizi (bkz. prefilter_for); içermeyen dosyalar decode edilmeden elenir.
+        index: root'un TrigramIndex'i; yalnızca aday dosyalar açılır. verify ile ardından
+        proje stat ile taranır, index'ten sonra değişen/eklenen dosyalar da aranır.
+        """
+        self.generation += 1
+        threading.Thread(target=self._run, args=(root, pattern, prefilter, index, verify, self.generation),
+                         daemon=True).start()
+        return self.generation
+
+    @staticmethod
+    def prefilter_for(text, case_sensitive=False, regex=False):
+        """Düz (ASCII) aramalar için byte ön filtresi; regex'te None"""
+        if regex or not text.isascii():
+            return None
+        needle = text.encode('ascii')
+        if case_sensitive:
+            return needle, False
+        needle = needle.lower()
+        # i, k, s re.IGNORECASE'de İ ı K ſ ile de eşleşir; bayt düzeyinde elenemez
+        if not TrigramIndex.UNICODE_FOLDS.isdisjoint(needle):
+            return None
+        return needle, True
+
+    def cancel(self):
+        self.generation += 1
+
+    @staticmethod
+    def iter_files(root):
+        """File tree ile aynı klasörleri atlayarak dosya yolları"""
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not _skip_dir(d)]
+            for filename in filenames:
+                yield os.path.join(dirpath, filename)
+
+    @classmethod
+    def read_bytes(cls, path):
+        """Dosya içeriği; binary veya çok büyükse None"""
+        try:
+            if os.path.getsize(path) > cls.MAX_FILE_SIZE:
+                return None
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if b'\0' in data[:cls.BINARY_SNIFF]:
+            return None
+        return data
+
+    @staticmethod
+    def decode(data):
+        # Editör dosyaları text mode ile açar: konumlar \n satır sonlarıyla eşleşsin
+        return data.decode('utf-8', errors='replace').replace('\r\n', '\n')
+
+    @classmethod
+    def read_text(cls, path):
+        """Dosyayı metin olarak oku; binary veya çok büyükse None"""
+        data = cls.read_bytes(path)
+        return None if data is None else cls.decode(data)
+
+    @classmethod
+    def search_text(cls, pattern, text):
+        """Metindeki eşleşmeler: (satır no, UTF-16 kolon, UTF-16 uzunluk, satır metni)"""
+        matches = []
+        line_number = 1
+        scanned = 0
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            line_number += text.count('\n', scanned, start)
+            scanned = start
+            line_start = text.rfind('\n', 0, start) + 1
+            line_end = text.find('\n', start)
+            if line_end == -1:
+                line_end = len(text)
+            line = text[line_start:line_end]
+            column = start - line_start
+            length = min(end, line_end) - start
+            if not line.isascii():
+                length = len(line[column:column + length].encode('utf-16-le')) // 2
+                column = len(line[:column].encode('utf-16-le')) // 2
+            matches.append((line_number, column, length, line[:cls.MAX_LINE_CHARS]))
+            if len(matches) >= cls.MAX_MATCHES_PER_FILE:
+                break
+        return matches
+
+    @classmethod
+    def plan_replacement(cls, path, pattern, replacement, expand=False):
+        """Dosyada yapılacak değişikliği hesapla; eşleşme yoksa veya binary ise None.
+
+        UTF-8 olmayan dosyalar yazılınca bozulacağı için UnicodeDecodeError fırlatılır.
+        """
+        try:
+            info = os.stat(path)
+        except OSError:
+            return None
+        data = cls.read_bytes(path)
+        if data is None:
+            return None
+        raw = data.decode('utf-8')
+        text = raw.replace('\r\n', '\n')
+        count, first, last, middle = replace_matches(pattern, text, replacement, expand)
+        if not count:
+            return None
+        new_text = text[:first] + middle + text[last:]
+        output = new_text if len(raw) == len(text) else cls._keep_line_endings(raw, text, pattern, replacement, expand)
+        return FileReplacement(path, text, new_text, count, output, (info.st_mtime_ns, info.st_size))
+
+    @staticmethod
+    def _keep_line_endings(raw, text, pattern, replacement, expand):
+        """Değişikliği \r\n içeren orijinal metne uygula; eşleşme dışındaki (karışık da olsa)
+        satır sonları aynen kalır, eklenen satır sonları dosyada çoğunlukta olanı kullanır"""
+        # text'te \r\n'den gelen \n'lerin konumları: text konumu -> raw konumu
+        crlf = [match.start() - index for index, match in enumerate(re.finditer('\r\n', raw))]
+        newline = '\r\n' if len(crlf) * 2 > text.count('\n') else '\n'
+        pieces = []
+        last = 0
+        for match in pattern.finditer(text):
+            start = match.start() + bisect.bisect_left(crlf, match.start())
+            end = match.end() + bisect.bisect_left(crlf, match.end())
+            pieces.append(raw[last:start])
+            value = match.expand(replacement) if expand else replacement
+            pieces.append(value.replace('\r\n', '\n').replace('\n', newline))
+            last = end
+        pieces.append(raw[last:])
+        return ''.join(pieces)
+
+    @classmethod
+    def plan_replacements(cls, paths, pattern, replacement, expand=False):
+        """Dosyaları paralel oku, değişiklikleri hesapla: ([FileReplacement], UTF-8 olmayan yollar)"""
+        with ThreadPoolExecutor(cls.WORKERS) as pool:
+            futures = [(path, pool.submit(cls.plan_replacement, path, pattern, replacement, expand))
+                       for path in paths]
+        entries = []
+        undecodable = []
+        for path, future in futures:
+            try:
+                entry = future.result()
+            except UnicodeDecodeError:
+                undecodable.append(path)
+                continue
+            if entry is not None:
+                entries.append(entry)
+        return entries, undecodable
+
+    @staticmethod
+    def write_replacement(entry):
+        """Değişikliği atomik yaz; dosya önizlemeden sonra diskte değiştiyse yazmadan False"""
+        info = os.stat(entry.path)
+        if (info.st_mtime_ns, info.st_size) != entry.stamp:
+            return False
+        _write_text_atomic(entry.path, entry.output)
+        return True
+
+    @classmethod
+    def write_replacements(cls, entries):
+        """Değişiklikleri paralel yaz: (yazılanlar, diskte değişmiş olanlar, [(entry, hata)])"""
+        written = []
+        changed = []
+        failed = []
+        with ThreadPoolExecutor(cls.WORKERS) as pool:
+            futures = [(entry, pool.submit(cls.write_replacement, entry)) for entry in entries]
+        for entry, future in futures:
+            try:
+                (written if future.result() else changed).append(entry)
+            except OSError as e:
+                failed.append((entry, e))
+        return written, changed, failed
+
+    def _search_file(self, path, pattern, prefilter, generation):
+        if generation != self.generation:
+            return 0
+        data = self.read_bytes(path)
+        if data is None:
+            return 0
+        # Çoğu dosya eşleşmez: decode etmeden byte düzeyinde ele
+        if prefilter is not None:
+            needle, fold = prefilter
+            if needle not in (data.lower() if fold else data):
+                return 0
+        text = self.decode(data)
+        if pattern.search(text) is None:
+            return 0
+        matches = self.search_text(pattern, text)
+        if matches and generation == self.generation:
+            self.file_matched.emit(generation, path, matches)
+        return len(matches)
+
+    def _paths(self, root, pattern, index, verify, stale):
+        """Aranacak dosyalar: index varsa adaylar, verify ile index'te güncel olmayanlar da"""
+        accept = index.matcher(pattern) if index is not None and index.root == root else None
+        if accept is None:
+            yield from self.iter_files(root)
+            return
+        snapshot = index.snapshot()
+        searched = set()
+        for path, entry in snapshot.items():
+            if accept(entry):
+                searched.add(path)
+                yield path
+        if not verify:
+            return
+        # Dışarıda yerinde değişen dosyalar klasör bildirimi üretmez: (mtime, boyut) kontrolü
+        for path in self.iter_files(root):
+            entry = snapshot.get(path)
+            try:
+                fresh = entry is not None and entry[:2] == index.stamp(path)
+            except OSError:
+                continue
+            if not fresh:
+                stale.append(path)
+                if path not in searched:
+                    yield path
+
+    def _run(self, root, pattern, prefilter, index, verify, generation):
+        started = time.perf_counter()
+        files = 0
+        total = 0
+        stale = []
+        with ThreadPoolExecutor(self.WORKERS) as pool:
+            futures = []
+            for path in self._paths(root, pattern, index, verify, stale):
+                if generation != self.generation:
+                    break
+                futures.append(pool.submit(self._search_file, path, pattern, prefilter, generation))
+                files += 1
+            for future in futures:
+                try:
+                    total += future.result()
+                except Exception as e:
+                    print(f"Find in files error: {e}")
+        if generation == self.generation:
+            self.finished.emit(generation, files, total, time.perf_counter() - started)
+        if stale:
+            index.update(stale)
+
+
 class ModernCodeEditor(QPlainTextEdit):
     INDENT_SIZE = 4
+    SEARCH_HIGHLIGHT_LIMIT = 2000  # Görünen alanda en fazla bu kadar eşleşme boyanır
+    SEARCH_HIGHLIGHT_COLOR = QColor(234, 92, 0, 90)
+
+    # Büyük dosya modu eşikleri (byte)
+    STREAM_THRESHOLD = 2 * 1024 * 1024
+    HIGHLIGHT_LIMIT = 8 * 1024 * 1024
+    MINIMAP_DETAIL_LIMIT = 8 * 1024 * 1024
+    AUTOCOMPLETE_LIMIT = 16 * 1024 * 1024
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Minimap ve satır numarası repaint'leri kare başına birleştirilir
+        self.repaints = RepaintCoalescer(self)
+        self._line_number_widths = {}  # basamak sayısı -> genişlik
+        self._viewport_left = None
         self.line_number_area = LineNumberArea(self)
         self.minimap = Minimap(self)
+        self.folds = FoldIndex(self)
         self.error_lines = []  # Hata satırlarını sakla
+        self._error_selections = []  # Sadece hata satırları değişince yeniden kurulur
+        # Find dialog'unun eşleşmeleri; yalnızca görünen aralıktakiler ExtraSelection olur
+        self._search_starts = array('l')
+        self._search_ends = array('l')
+        self._search_selections = []
+        self._search_range = None
+        self.loader = None
+        self.highlighting_enabled = True
+        self.autocomplete_enabled = True
 
         self._setup_appearance()
         self._setup_autocomplete()
@@ -331,80 +2876,20 @@ class ModernCodeEditor(QPlainTextEdit):
         self.highlighter = Pide(self.document())
     
     def _setup_autocomplete(self):
-        """Autocomplete (Ctrl+Space) için QCompleter kur"""
-        # Snippet şablonları
-        self.snippets = {
-            'def': 'def function_name():\n    pass',
-            'class': 'class ClassName:\n    def __init__(self):\n        pass',
-            'if': 'if condition:\n    pass',
-            'for': 'for item in items:\n    pass',
-            'while': 'while condition:\n    pass',
-            'try': 'try:\n    pass\nexcept Exception as e:\n    pass',
-            'with': 'with open("file.txt", "r") as f:\n    content = f.read()',
-            'main': 'if __name__ == "__main__":\n    pass',
-            'init': 'def __init__(self):\n    pass',
-            'str': 'def __str__(self):\n    return ""',
-            'repr': 'def __repr__(self):\n    return ""',
-        }
-        
-        # Python keywords ve builtins
-        keywords = [
-            'False', 'None', 'True', 'and', 'as', 'assert', 'async', 'await',
-            'break', 'class', 'continue', 'def', 'del', 'elif', 'else', 'except',
-            'finally', 'for', 'from', 'global', 'if', 'import', 'in', 'is',
-            'lambda', 'nonlocal', 'not', 'or', 'pass', 'raise', 'return',
-            'try', 'while', 'with', 'yield'
-        ]
-        
-        builtins = [
-            'abs', 'all', 'any', 'ascii', 'bin', 'bool', 'bytearray', 'bytes',
-            'callable', 'chr', 'classmethod', 'compile', 'complex', 'delattr',
-            'dict', 'dir', 'divmod', 'enumerate', 'eval', 'exec', 'filter',
-            'float', 'format', 'frozenset', 'getattr', 'globals', 'hasattr',
-            'hash', 'help', 'hex', 'id', 'input', 'int', 'isinstance',
-            'issubclass', 'iter', 'len', 'list', 'locals', 'map', 'max',
-            'memoryview', 'min', 'next', 'object', 'oct', 'open', 'ord',
-            'pow', 'print', 'property', 'range', 'repr', 'reversed', 'round',
-            'set', 'setattr', 'slice', 'sorted', 'staticmethod', 'str', 'sum',
-            'super', 'tuple', 'type', 'vars', 'zip', '__import__'
-        ]
-        
-        # Common modules
-        modules = [
-            'os', 'sys', 'math', 'random', 'datetime', 'time', 'json', 're',
-            'collections', 'itertools', 'functools', 'pathlib', 'subprocess',
-            'threading', 'multiprocessing', 'requests', 'numpy', 'pandas'
-        ]
-        
-        # Tüm kelimeler
-        self.autocomplete_words = sorted(set(keywords + builtins + modules))
-        
-        # QCompleter oluştur
-        self.completer = QCompleter(self.autocomplete_words)
-        self.completer.setWidget(self)
-        self.completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self.completer.setCompletionMode(QCompleter.PopupCompletion)
-        self.completer.activated.connect(self._insert_completion)
-        
-        # Completer popup stili
-        self.completer.popup().setStyleSheet("""
-            QListView {
-                background-color: #2d2d2d;
-                color: #d4d4d4;
-                border: 1px solid #007acc;
-                selection-background-color: #094771;
-                font-family: 'Consolas', monospace;
-                font-size: 11pt;
-            }
-        """)
+        """Autocomplete (Ctrl+Space): completer ve model tüm editörlerce paylaşılır"""
+        self.snippets = CompletionModel.SNIPPETS
+
+    @property
+    def completer(self):
+        return CompletionModel.instance().completer_for(self)
     
     def _insert_completion(self, completion):
         """Seçilen completion'ı ekle"""
         cursor = self.textCursor()
-        extra = len(completion) - len(self.completer.completionPrefix())
-        cursor.movePosition(QTextCursor.Left)
-        cursor.movePosition(QTextCursor.EndOfWord)
-        cursor.insertText(completion[-extra:])
+        # Fuzzy eşleşmede yazılan kısım completion'ın prefix'i olmayabilir: kelimeyi değiştir.
+        # Prefix _text_under_cursor'dan gelir; kelimenin ortasında da aynı seçim tamamı kapsar
+        cursor.select(QTextCursor.WordUnderCursor)
+        cursor.insertText(completion)
         self.setTextCursor(cursor)
     
     def _text_under_cursor(self):
@@ -416,17 +2901,32 @@ class ModernCodeEditor(QPlainTextEdit):
     def _connect_signals(self):
         self.blockCountChanged.connect(self.update_line_number_area_width)
         self.updateRequest.connect(self.update_line_number_area)
-        self.updateRequest.connect(lambda: self.minimap.update())  # Minimap güncelle
+        self.updateRequest.connect(lambda: self.repaints.request(self.minimap))  # Minimap güncelle
+        self.cursorPositionChanged.connect(self._reveal_cursor)
         self.cursorPositionChanged.connect(self.highlight_current_line)
         self.textChanged.connect(self._on_text_changed)
-        self.textChanged.connect(lambda: self.minimap.update())  # Minimap güncelle
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.highlighter.blocks_highlighted.connect(self.minimap.refresh_colors)
         
+    def _reveal_cursor(self):
+        """Cursor katlı bir bölgeye atlarsa (arama, hata satırı, minimap) bölgeyi aç"""
+        if self.folds.folded and not self.textCursor().block().isVisible():
+            self.folds.reveal(self.textCursor().blockNumber())
+
+    def _on_scrolled(self):
+        """Lazy highlighting sürerken yeni görünen alanı öncelikli boya"""
+        if self.highlighter.lazy_active:
+            self._highlight_visible_blocks()
+        self._update_search_selections()
+
     def _on_text_changed(self):
         """Metin değiştiğinde module'leri yeniden parse et"""
+        if self.is_loading or not self.highlighting_enabled:
+            return
         if hasattr(self, '_parse_timer'):
             self._parse_timer.stop()
         else:
-            self._parse_timer = QTimer()
+            self._parse_timer = QTimer(self)  # Editörle birlikte silinsin
             self._parse_timer.setSingleShot(True)
             self._parse_timer.timeout.connect(lambda: self.highlighter.parse_full_document())
         self._parse_timer.start(1000)  # 1 saniye bekle
@@ -435,22 +2935,157 @@ class ModernCodeEditor(QPlainTextEdit):
         self.update_line_number_area_width(0)
         self.highlight_current_line()
 
+    def set_text_lazily(self, text):
+        """Metni yükle: önce görünen alanı highlight et, kalanı boşta doldur"""
+        self.highlighter.deferred = True
+        try:
+            self.setPlainText(text)
+        finally:
+            self.highlighter.deferred = False
+        self._highlight_visible_blocks()
+        self.highlighter.start_lazy_fill()
+
+    def replace_range(self, start, end, text):
+        """[start, end) aralığını tek düzenleme (tek undo adımı) ile değiştir.
+
+        Highlight düzenleme sırasında ertelenir: önce görünen alan, kalanı lazy fill ile.
+        """
+        highlighter = self.highlighter
+        lazy = highlighter.document() is not None and not highlighter.deferred
+        cursor = QTextCursor(self.document())
+        cursor.beginEditBlock()
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        highlighter.deferred = lazy or highlighter.deferred
+        try:
+            cursor.insertText(text)
+            cursor.endEditBlock()
+        finally:
+            if lazy:
+                highlighter.deferred = False
+        if lazy:
+            # İlk blok düzenlemede yeniden kullanılır (userData'sı durur), kalanlar yeni bloklar
+            highlighter.rehighlightBlock(self.document().findBlock(start))
+            self._highlight_visible_blocks()
+            highlighter.start_lazy_fill()
+
+    def raw_text(self):
+        """toPlainText gibi, fakat NBSP boşluğa çevrilmez (konumlar aynı kalır)"""
+        # toRawText blokları U+2029 ile ayırır, NBSP'ye dokunmaz
+        return self.document().toRawText().replace('\u2029', '\n')
+
+    def replace_all_matches(self, pattern, replacement, expand=False):
+        """Belgedeki tüm eşleşmeleri tek düzenleme ile değiştir, değişen sayısını döner"""
+        # toPlainText ile kurulan metin değişen aralıktaki NBSP'leri boşluğa çevirirdi
+        text = self.raw_text()
+        count, first, last, middle = replace_matches(pattern, text, replacement, expand)
+        if count:
+            # Yalnızca ilk ve son eşleşme arası tek düzenleme ile değişir
+            wide = self.document().characterCount() - 1 != len(text)  # BMP dışı karakter var
+            self.replace_range(self._utf16_offset(text, first, wide),
+                               self._utf16_offset(text, last, wide), middle)
+        return count
+
+    @staticmethod
+    def _utf16_offset(text, index, wide):
+        """Python string index'i -> QTextDocument konumu (BMP dışı karakterler 2 birim)"""
+        if not wide:
+            return index
+        return len(text[:index].encode('utf-16-le')) // 2
+
+    def load_file_streamed(self, path):
+        """Büyük dosyayı arka planda parça parça yükle; ağır özellikleri eşiklere göre kapat"""
+        self.loader = FileLoader(path, self)
+        size = self.loader.total
+        self.highlighting_enabled = size <= self.HIGHLIGHT_LIMIT
+        self.autocomplete_enabled = size <= self.AUTOCOMPLETE_LIMIT
+        self.minimap.detail = size <= self.MINIMAP_DETAIL_LIMIT
+        if self.highlighting_enabled:
+            # Yükleme bitince görünen alan + lazy fill ile boyanacak
+            self.highlighter.deferred = True
+        else:
+            self.highlighter.setDocument(None)
+
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.loader.chunk_loaded.connect(self._append_chunk)
+        self.loader.finished.connect(self._on_load_finished)
+        self.loader.failed.connect(self._on_load_failed)
+        self.loader.start()
+        return self.loader
+
+    def _append_chunk(self, chunk):
+        """Okunan parçayı belgenin sonuna ekle"""
+        if self.loader is None:  # İptal edildi, kuyrukta kalan parça
+            return
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(chunk)
+        self.loader.chunk_consumed()
+
+    def _on_load_finished(self):
+        """Streamed yükleme bitti: düzenlemeyi ve highlighting'i aç"""
+        self.loader = None
+        self.setUndoRedoEnabled(True)
+        self.setReadOnly(False)
+        self.moveCursor(QTextCursor.Start)
+        if self.highlighting_enabled:
+            self.highlighter.deferred = False
+            self._highlight_visible_blocks()
+            self.highlighter.start_lazy_fill()
+        self.highlight_current_line()
+
+    def _on_load_failed(self, message):
+        """Yükleme yarıda kaldı: eksik içerik salt okunur kalır, dosyanın üzerine kaydedilemez"""
+        self._on_load_finished()
+        self.setReadOnly(True)
+
+    def cancel_loading(self):
+        """Süren streamed yüklemeyi durdur (tab kapanırken)"""
+        if self.loader is not None:
+            self.loader.cancel()
+            self.loader = None
+
+    @property
+    def is_loading(self):
+        return self.loader is not None
+
+    def _highlight_visible_blocks(self):
+        """Görünen alandaki henüz highlight edilmemiş blokları hemen işle"""
+        line_height = max(1, self.fontMetrics().height())
+        visible = self.viewport().height() // line_height + 2
+        self.highlighter.highlight_blocks(self.firstVisibleBlock(), visible)
+
     def line_number_area_width(self):
         digits = len(str(max(1, self.blockCount())))
-        space = 15 + self.fontMetrics().horizontalAdvance('9') * digits
+        space = self._line_number_widths.get(digits)
+        if space is None:
+            space = 15 + LineNumberArea.FOLD_MARKER_WIDTH + self.fontMetrics().horizontalAdvance('9') * digits
+            self._line_number_widths[digits] = space
         return space
 
     def update_line_number_area_width(self, _):
-        self.setViewportMargins(self.line_number_area_width(), 0, 0, 0)
+        width = self.line_number_area_width()
+        if width != self._viewport_left:
+            self._viewport_left = width
+            # Minimap viewport'un üstüne binmez: her scroll'da onu da repaint ettirmesin
+            self.setViewportMargins(width, 0, self.minimap.width(), 0)
 
     def update_line_number_area(self, rect, dy):
         if dy:
-            self.line_number_area.scroll(0, dy)
+            # Boştayken aynı olay turunda, hızlı scroll'da kare başına bir kez boyanır
+            self.repaints.request(self.line_number_area)
         else:
-            self.line_number_area.update(0, rect.y(), self.line_number_area.width(), rect.height())
+            self.repaints.request(self.line_number_area, QRect(0, rect.y(), self.line_number_area.width(), rect.height()))
         if rect.contains(self.viewport().rect()):
             self.update_line_number_area_width(0)
 
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self._line_number_widths.clear()
+            self.update_line_number_area_width(0)
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         cr = self.contentsRect()
@@ -458,9 +3093,10 @@ class ModernCodeEditor(QPlainTextEdit):
         # Line number area (sol)
         self.line_number_area.setGeometry(QRect(cr.left(), cr.top(), self.line_number_area_width(), cr.height()))
         
-        # Minimap (sağ)
+        # Minimap (sağ): viewport ile scrollbar arasında ayrılan boşluk
         minimap_width = self.minimap.width()
-        self.minimap.setGeometry(QRect(cr.right() - minimap_width, cr.top(), minimap_width, cr.height()))
+        self.minimap.setGeometry(QRect(self.viewport().geometry().right() + 1, cr.top(), minimap_width, cr.height()))
+        self._update_search_selections()
 
     def line_number_area_paint_event(self, event):
         self.line_number_area.paintEvent(event)
@@ -469,36 +3105,85 @@ class ModernCodeEditor(QPlainTextEdit):
         if self.isReadOnly():
             return
 
-        extra_selections = []
-        
-        # Hata satırlarını vurgula (kırmızı)
-        for line_num in self.error_lines:
-            selection = QTextEdit.ExtraSelection()
-            selection.format.setBackground(QColor(255, 0, 0, 40))
-            selection.format.setProperty(QTextFormat.FullWidthSelection, True)
-            cursor = QTextCursor(self.document().findBlockByLineNumber(line_num - 1))
-            selection.cursor = cursor
-            selection.cursor.clearSelection()
-            extra_selections.append(selection)
-        
-        # Mevcut satırı vurgula (gri)
+        # Mevcut satırı vurgula (gri); hata satırları önbellekten olduğu gibi eklenir
         selection = QTextEdit.ExtraSelection()
         selection.format.setBackground(QColor(46, 46, 46, 100))
         selection.format.setProperty(QTextFormat.FullWidthSelection, True)
         selection.cursor = self.textCursor()
         selection.cursor.clearSelection()
-        extra_selections.append(selection)
 
-        self.setExtraSelections(extra_selections)
+        self.setExtraSelections(self._error_selections + [selection] + self._search_selections)
+
+    def set_search_matches(self, starts, ends):
+        """Highlight-all için eşleşme konumları (sıralı, çakışmasız)"""
+        self._search_starts = starts
+        self._search_ends = ends
+        self._search_range = None
+        self._update_search_selections()
+
+    def clear_search_matches(self):
+        self.set_search_matches(array('l'), array('l'))
+
+    def _visible_range(self):
+        """Görünen alanın doküman konumları [başlangıç, bitiş)"""
+        viewport = self.viewport()
+        last = self.cursorForPosition(QPoint(viewport.width(), viewport.height())).block()
+        return self.firstVisibleBlock().position(), last.position() + last.length()
+
+    def _update_search_selections(self):
+        """Görünen aralık değiştiyse eşleşme seçimlerini yeniden kur"""
+        if not self._search_starts and not self._search_selections:
+            return
+        visible = self._visible_range()
+        if visible == self._search_range:
+            return
+        self._search_range = visible
+
+        first_position, last_position = visible
+        first = bisect.bisect_right(self._search_ends, first_position)
+        last = min(bisect.bisect_left(self._search_starts, last_position), first + self.SEARCH_HIGHLIGHT_LIMIT)
+        search_format = QTextCharFormat()
+        search_format.setBackground(self.SEARCH_HIGHLIGHT_COLOR)
+        document = self.document()
+        selections = []
+        for index in range(first, last):
+            selection = QTextEdit.ExtraSelection()
+            selection.format = search_format
+            selection.cursor = QTextCursor(document)
+            selection.cursor.setPosition(self._search_starts[index])
+            selection.cursor.setPosition(self._search_ends[index], QTextCursor.KeepAnchor)
+            selections.append(selection)
+        self._search_selections = selections
+        self.highlight_current_line()
+
+    def _build_error_selections(self):
+        """Hata satırları için seçimleri bir kez kur (cursor'lar düzenlemelerle birlikte kayar)"""
+        error_format = QTextCharFormat()
+        error_format.setBackground(QColor(255, 0, 0, 40))
+        error_format.setProperty(QTextFormat.FullWidthSelection, True)
+
+        selections = []
+        document = self.document()
+        for line_num in sorted(set(self.error_lines)):
+            block = document.findBlockByNumber(line_num - 1)
+            if not block.isValid():
+                continue
+            selection = QTextEdit.ExtraSelection()
+            selection.format = error_format
+            selection.cursor = QTextCursor(block)
+            selections.append(selection)
+        return selections
     
     def set_error_lines(self, line_numbers):
         """Hata satırlarını ayarla ve vurgula"""
         self.error_lines = line_numbers
+        self._error_selections = self._build_error_selections()
         self.highlight_current_line()
         
     def clear_error_lines(self):
         """Hata vurgularını temizle"""
         self.error_lines = []
+        self._error_selections = []
         self.highlight_current_line()
 
     def keyPressEvent(self, event):
@@ -508,7 +3193,7 @@ class ModernCodeEditor(QPlainTextEdit):
             return
         
         # Completer açıksa ve özel tuşlar
-        if self.completer.popup().isVisible():
+        if CompletionModel.instance().popup_visible(self):
             if event.key() in (Qt.Key_Enter, Qt.Key_Return, Qt.Key_Escape, Qt.Key_Tab, Qt.Key_Backtab):
                 event.ignore()
                 return
@@ -534,7 +3219,7 @@ class ModernCodeEditor(QPlainTextEdit):
         elif key == Qt.Key_Return:
             current_line = cursor.block().text()
             leading_spaces = len(current_line) - len(current_line.lstrip(' '))
-            if current_line.strip().endswith(':'):
+            if current_line.strip().endswith(':') or self._opens_bracket(cursor.block()):
                 leading_spaces += self.INDENT_SIZE
             super().keyPressEvent(event)
             self.insertPlainText(" " * leading_spaces)
@@ -552,13 +3237,24 @@ class ModernCodeEditor(QPlainTextEdit):
         if event.text().isalnum() or event.text() == '_':
             self._update_autocomplete()
     
+    def _opens_bracket(self, block):
+        """Satır yeni bir parantez açıp kapatmadan bitiyor mu"""
+        depth = self.highlighter.bracket_depth(block)
+        return depth > self.highlighter.bracket_depth(block.previous())
+
     def _show_autocomplete(self):
         """Autocomplete popup'ı göster"""
+        if not self.autocomplete_enabled:
+            return
         completion_prefix = self._text_under_cursor()
         if len(completion_prefix) < 1:
             return
         
+        self._update_completion_words(completion_prefix)
         self.completer.setCompletionPrefix(completion_prefix)
+        if not self.completer.completionModel().rowCount():
+            self.completer.popup().hide()
+            return
         popup = self.completer.popup()
         popup.setCurrentIndex(self.completer.completionModel().index(0, 0))
         
@@ -571,16 +3267,26 @@ class ModernCodeEditor(QPlainTextEdit):
     
     def _update_autocomplete(self):
         """Yazarken autocomplete'i otomatik güncelle"""
+        if not self.autocomplete_enabled:
+            return
         completion_prefix = self._text_under_cursor()
         if len(completion_prefix) < 2:  # En az 2 karakter
             self.completer.popup().hide()
             return
         
         if completion_prefix != self.completer.completionPrefix():
+            self._update_completion_words(completion_prefix)
             self.completer.setCompletionPrefix(completion_prefix)
             popup = self.completer.popup()
-            popup.setCurrentIndex(self.completer.completionModel().index(0, 0))
+            if self.completer.completionModel().rowCount():
+                popup.setCurrentIndex(self.completer.completionModel().index(0, 0))
+            else:
+                popup.hide()
     
+    def _update_completion_words(self, prefix):
+        """Paylaşılan modeli doldur; dokümanın kendi isimleri (Pide name_index) üstüne eklenir"""
+        CompletionModel.instance().update(prefix, self.highlighter.name_index)
+
     def _try_expand_snippet(self):
         """Tab tuşuna basıldığında snippet expand et"""
         cursor = self.textCursor()
@@ -633,9 +3339,10 @@ class OutputConsole(QTextEdit):
 
 class FindReplaceDialog(QDialog):
     """Find & Replace dialog"""
+    REINDEX_DELAY_MS = 150
     def __init__(self, editor, parent=None):
         super().__init__(parent)
-        self.editor = editor
+        self.editor = None
         self.setWindowTitle("Find & Replace")
         self.setMinimumWidth(500)
         
@@ -648,6 +3355,9 @@ class FindReplaceDialog(QDialog):
         self.find_input.setPlaceholderText("Search text...")
         self.find_input.textChanged.connect(self._on_find_text_changed)
         find_layout.addWidget(self.find_input)
+        self.match_count_label = QLabel("")
+        self.match_count_label.setMinimumWidth(110)
+        find_layout.addWidget(self.match_count_label)
         layout.addLayout(find_layout)
         
         # Replace section
@@ -663,9 +3373,9 @@ class FindReplaceDialog(QDialog):
         self.case_sensitive_cb = QCheckBox("Case sensitive")
         self.whole_word_cb = QCheckBox("Whole word")
         self.regex_cb = QCheckBox("Regex")
-        options_layout.addWidget(self.case_sensitive_cb)
-        options_layout.addWidget(self.whole_word_cb)
-        options_layout.addWidget(self.regex_cb)
+        for checkbox in (self.case_sensitive_cb, self.whole_word_cb, self.regex_cb):
+            checkbox.toggled.connect(self._on_find_text_changed)
+            options_layout.addWidget(checkbox)
         options_layout.addStretch()
         layout.addLayout(options_layout)
         
@@ -728,7 +3438,155 @@ class FindReplaceDialog(QDialog):
             }
         """)
         
+        # Eşleşmeler arka planda indexlenir; sorgu veya doküman değişince yeniden başlar
+        self.indexer = MatchIndexer(self)
+        self.indexer.finished.connect(self._on_matches_indexed)
+        self._starts = None  # Güncel index yoksa None
+        self._ends = None
+        self._jump_to_first = False
+        self._reindex_timer = QTimer(self)
+        self._reindex_timer.setSingleShot(True)
+        self._reindex_timer.timeout.connect(self._reindex)
+        self.set_editor(editor)
+
         self.find_input.setFocus()
+
+    def set_editor(self, editor):
+        """Dialog'u başka bir editöre bağla (açıksa bağlantılar ve index taşınır)"""
+        if editor is self.editor:
+            return
+        visible = self.isVisible()
+        if visible:
+            self._detach()
+        if self._editor_alive():
+            self.editor.destroyed.disconnect(self._on_editor_destroyed)
+        self.editor = editor
+        editor.destroyed.connect(self._on_editor_destroyed)
+        if visible:
+            self._attach()
+
+    def _editor_alive(self):
+        # Kapatılan sekmenin editörü deleteLater ile silinir
+        return self.editor is not None and not sip.isdeleted(self.editor)
+
+    def _on_editor_destroyed(self):
+        """Editörün sekmesi kapandı: dialog da kapanır"""
+        self.editor = None
+        self.close()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._attach()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._detach()
+
+    def _attach(self):
+        if not self._editor_alive():
+            return
+        self.editor.document().contentsChanged.connect(self._on_document_changed)
+        self.editor.cursorPositionChanged.connect(self._update_match_count)
+        if self.find_input.text():
+            self._reindex()
+
+    def _detach(self):
+        self._reindex_timer.stop()
+        self.indexer.cancel()
+        self._starts = self._ends = None
+        if not self._editor_alive():
+            return
+        self.editor.document().contentsChanged.disconnect(self._on_document_changed)
+        self.editor.cursorPositionChanged.disconnect(self._update_match_count)
+        self.editor.clear_search_matches()
+
+    def _on_document_changed(self):
+        """Düzenlemeden sonra konumlar eskidi: kısa bir beklemeden sonra yeniden indexle"""
+        if not self._editor_alive():
+            return
+        self.indexer.cancel()  # Süren tarama eski metnin konumlarını getirmesin
+        self._starts = self._ends = None
+        if self.find_input.text():
+            self._reindex_timer.start(self.REINDEX_DELAY_MS)
+
+    def _reindex(self):
+        """Eşleşme indexini arka planda yeniden hesapla (süren arama iptal edilir)"""
+        self._starts = self._ends = None
+        if not self._editor_alive():
+            self.indexer.cancel()
+            return
+        if not self.find_input.text():
+            self.indexer.cancel()
+            self.editor.clear_search_matches()
+            self.match_count_label.setText("")
+            return
+        try:
+            pattern = self._search_regex()
+        except re.error:
+            self.indexer.cancel()
+            self.editor.clear_search_matches()
+            self.match_count_label.setText("Invalid regex")
+            return
+        self.match_count_label.setText("Searching...")
+        self.indexer.start(pattern, self.editor.document().toPlainText())
+
+    def _on_matches_indexed(self, generation, starts, ends):
+        if generation != self.indexer.generation or not self._editor_alive():
+            return
+        self._starts, self._ends = starts, ends
+        self.editor.set_search_matches(starts, ends)
+        if self._jump_to_first:
+            # Yazarken: cursor'dan itibaren ilk eşleşmeyi seç (aynı eşleşme genişleyebilir)
+            self._jump_to_first = False
+            if starts:
+                index = bisect.bisect_left(starts, self.editor.textCursor().selectionStart())
+                self._select_match(index % len(starts))
+        self._update_match_count()
+
+    def _update_match_count(self):
+        """'N of M': seçim bir eşleşmeyse sırası, değilse toplam"""
+        if self._starts is None or not self._editor_alive():
+            return
+        total = len(self._starts)
+        if not total:
+            self.match_count_label.setText("No results")
+            return
+        cursor = self.editor.textCursor()
+        index = bisect.bisect_left(self._starts, cursor.selectionStart())
+        if index < total and self._starts[index] == cursor.selectionStart() and self._ends[index] == cursor.selectionEnd():
+            self.match_count_label.setText(f"{index + 1} of {total}")
+        else:
+            self.match_count_label.setText(f"{total} matches")
+
+    def _select_match(self, index):
+        cursor = self.editor.textCursor()
+        cursor.setPosition(self._starts[index])
+        cursor.setPosition(self._ends[index], QTextCursor.KeepAnchor)
+        self.editor.setTextCursor(cursor)
+        self._update_match_count()
+
+    def _step_match(self, forward):
+        """Index üzerinden sonraki/önceki eşleşme (sona gelince başa sarar)"""
+        total = len(self._starts)
+        if not total:
+            self.status_label.setText("⚠ Not found")
+            self.status_label.setStyleSheet("color: #ff9800;")
+            return
+        cursor = self.editor.textCursor()
+        if forward:
+            index = bisect.bisect_left(self._starts, cursor.selectionEnd())
+            if index < total and self._starts[index] == self._ends[index] == cursor.selectionStart():
+                index += 1  # Boş eşleşmede yerinde sayma
+        else:
+            index = bisect.bisect_left(self._starts, cursor.selectionStart()) - 1
+        wrapped = not 0 <= index < total
+        self._select_match(index % total)
+        if wrapped:
+            self.status_label.setText("⚠ Wrapped to start" if forward else "⚠ Wrapped to end")
+            self.status_label.setStyleSheet("color: #ff9800;")
+        else:
+            self.status_label.setText("✓ Found")
+            self.status_label.setStyleSheet("color: #4caf50;")
     
     def _get_search_flags(self):
         """QTextDocument search flags'lerini al"""
@@ -740,15 +3598,21 @@ class FindReplaceDialog(QDialog):
         return flags
     
     def _on_find_text_changed(self):
-        """Find text değiştiğinde ilk eşleşmeyi bul"""
-        if self.find_input.text():
-            self._find_next()
+        """Find text değiştiğinde index'i arka planda kur; hazır olunca ilk eşleşmeyi seç"""
+        self._jump_to_first = bool(self.find_input.text())
+        self._starts = self._ends = None
+        self.match_count_label.setText("Searching..." if self._jump_to_first else "")
+        # Hızlı yazarken doküman her tuşta kopyalanmasın
+        self._reindex_timer.start(self.REINDEX_DELAY_MS)
     
     def _find_next(self):
         """Sonraki eşleşmeyi bul"""
         search_text = self.find_input.text()
         if not search_text:
             return
+        if self._starts is not None:
+            self._step_match(True)
+            return
         
         cursor = self.editor.textCursor()
         
@@ -778,6 +3642,9 @@ class FindReplaceDialog(QDialog):
         search_text = self.find_input.text()
         if not search_text:
             return
+        if self._starts is not None:
+            self._step_match(False)
+            return
         
         cursor = self.editor.textCursor()
         flags = self._get_search_flags() | QTextDocument.FindBackward
@@ -810,43 +3677,328 @@ class FindReplaceDialog(QDialog):
             self.status_label.setStyleSheet("color: #4caf50;")
             self._find_next()
     
+    def _search_regex(self):
+        """Find alanı ve seçeneklerden derlenmiş Python regex'i (geçersizse re.error)"""
+        return compile_search(self.find_input.text(), self.case_sensitive_cb.isChecked(),
+                              self.whole_word_cb.isChecked(), self.regex_cb.isChecked())
+
     def _replace_all(self):
-        """Tüm eşleşmeleri değiştir"""
+        """Tüm eşleşmeleri düz metin üzerinde tek geçişte hesapla, tek düzenleme ile uygula"""
         search_text = self.find_input.text()
         replace_text = self.replace_input.text()
         
         if not search_text:
             return
-        
-        cursor = self.editor.textCursor()
-        cursor.beginEditBlock()
-        
-        # Başa git
-        cursor.movePosition(QTextCursor.Start)
-        self.editor.setTextCursor(cursor)
-        
-        count = 0
-        while True:
-            if self.regex_cb.isChecked():
-                pattern = QRegExp(search_text)
-                if not self.case_sensitive_cb.isChecked():
-                    pattern.setCaseSensitivity(Qt.CaseInsensitive)
-                found_cursor = self.editor.document().find(pattern, cursor)
-            else:
-                found_cursor = self.editor.document().find(search_text, cursor, self._get_search_flags())
-            
-            if found_cursor.isNull():
-                break
-            
-            found_cursor.insertText(replace_text)
-            cursor = found_cursor
-            count += 1
-        
-        cursor.endEditBlock()
-        self.status_label.setText(f"✓ Replaced {count} occurrence(s)")
+
+        started = time.perf_counter()
+        try:
+            # \1, \g<name> yalnızca regex modunda
+            count = self.editor.replace_all_matches(self._search_regex(), replace_text, self.regex_cb.isChecked())
+        except re.error as e:
+            self.status_label.setText(f"⚠ Invalid regex: {e}")
+            self.status_label.setStyleSheet("color: #f44336;")
+            return
+
+        elapsed = (time.perf_counter() - started) * 1000
+        self.status_label.setText(f"✓ Replaced {count} occurrence(s) in {elapsed:.0f} ms")
         self.status_label.setStyleSheet("color: #4caf50;")
 
 
+class FindInFilesPanel(QWidget):
+    """Projede arama paneli: sonuçlar bulundukça dosya -> satır ağacına eklenir"""
+    location_requested = pyqtSignal(str, int, int, int)  # yol, satır, kolon, uzunluk
+    replace_requested = pyqtSignal(object, str, bool, object)  # pattern, yeni metin, grupları aç, yollar
+
+    MAX_RESULTS = 20000  # Ağaç bu kadar satırdan sonra büyümez, sayım devam eder
+
+    def __init__(self, project_path, parent=None):
+        super().__init__(parent)
+        self.project_path = project_path
+        self.search = ProjectSearch(self)
+        self.search.file_matched.connect(self._on_file_matched)
+        self.search.finished.connect(self._on_finished)
+        self._generation = None
+        self._shown = 0
+        self._files = 0
+        self._searched = None   # son aramanın (sorgu, seçenekler) anahtarı
+        self._pattern = None
+        self._matched_paths = []
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+
+        query_layout = QHBoxLayout()
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText("Search in project files...")
+        self.query_input.returnPressed.connect(self.start_search)
+        query_layout.addWidget(self.query_input)
+        self.case_sensitive_cb = QCheckBox("Aa")
+        self.case_sensitive_cb.setToolTip("Case sensitive")
+        self.whole_word_cb = QCheckBox("Word")
+        self.whole_word_cb.setToolTip("Whole word")
+        self.regex_cb = QCheckBox(".*")
+        self.regex_cb.setToolTip("Regex")
+        for checkbox in (self.case_sensitive_cb, self.whole_word_cb, self.regex_cb):
+            query_layout.addWidget(checkbox)
+        self.search_button = QPushButton("🔍 Search")
+        self.search_button.clicked.connect(self._on_search_button)
+        query_layout.addWidget(self.search_button)
+        layout.addLayout(query_layout)
+
+        replace_layout = QHBoxLayout()
+        self.replace_input = QLineEdit()
+        self.replace_input.setPlaceholderText("Replace with...")
+        replace_layout.addWidget(self.replace_input)
+        self.replace_button = QPushButton("Replace All...")
+        self.replace_button.setToolTip("Preview and replace in all matched files")
+        self.replace_button.clicked.connect(self._on_replace_button)
+        replace_layout.addWidget(self.replace_button)
+        layout.addLayout(replace_layout)
+
+        self.results = QTreeWidget()
+        self.results.setHeaderHidden(True)
+        self.results.setUniformRowHeights(True)
+        self.results.itemActivated.connect(self._on_item_activated)
+        layout.addWidget(self.results)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        self.setStyleSheet("""
+            QLineEdit {
+                background-color: #2d2d2d;
+                color: #d4d4d4;
+                border: 1px solid #3e3e3e;
+                padding: 4px;
+                font-family: 'Consolas', monospace;
+            }
+            QLineEdit:focus {
+                border: 1px solid #007acc;
+            }
+            QTreeWidget {
+                background-color: #1e1e1e;
+                color: #d4d4d4;
+                border: none;
+                font-family: 'Consolas', monospace;
+            }
+            QTreeWidget::item:selected {
+                background-color: #094771;
+            }
+            QCheckBox, QLabel {
+                color: #d4d4d4;
+            }
+            QPushButton {
+                background-color: #404040;
+                color: #d4d4d4;
+                border: 1px solid #555555;
+                padding: 4px 10px;
+            }
+        """)
+
+    @property
+    def is_searching(self):
+        return self._generation is not None
+
+    def _on_search_button(self):
+        if self.is_searching:
+            self.cancel_search()
+        else:
+            self.start_search()
+
+    def _query_key(self):
+        return (self.query_input.text(), self.case_sensitive_cb.isChecked(),
+                self.whole_word_cb.isChecked(), self.regex_cb.isChecked())
+
+    def start_search(self):
+        """Sorguyu derle ve aramayı başlat (süren arama iptal edilir)"""
+        text, case_sensitive, whole_word, regex = self._query_key()
+        if not text:
+            return
+        try:
+            pattern = compile_search(text, case_sensitive, whole_word, regex)
+        except re.error as e:
+            self.status_label.setText(f"⚠ Invalid regex: {e}")
+            return
+        self.results.clear()
+        self._shown = 0
+        self._files = 0
+        self._searched = self._query_key()
+        self._pattern = pattern
+        self._matched_paths = []
+        prefilter = ProjectSearch.prefilter_for(text, case_sensitive, regex)
+        self._generation = self.search.start(self.project_path, pattern, prefilter, TrigramIndex.instance())
+        self.search_button.setText("⏹ Cancel")
+        self.status_label.setText("Searching...")
+
+    def cancel_search(self):
+        if self.is_searching:
+            self.search.cancel()
+            self._generation = None
+            self.search_button.setText("🔍 Search")
+            self.status_label.setText(f"Cancelled: {self._shown} result(s) in {self._files} file(s)")
+
+    def _on_file_matched(self, generation, path, matches):
+        if generation != self._generation:
+            return
+        self._files += 1
+        self._matched_paths.append(path)
+        if self._shown >= self.MAX_RESULTS:
+            return
+        file_item = QTreeWidgetItem([f"{os.path.relpath(path, self.project_path)}  ({len(matches)})"])
+        file_item.setData(0, Qt.UserRole, (path, 1, 0, 0))
+        children = []
+        for line_number, column, length, line in matches[:self.MAX_RESULTS - self._shown]:
+            child = QTreeWidgetItem([f"{line_number}: {line.strip()}"])
+            child.setData(0, Qt.UserRole, (path, line_number, column, length))
+            children.append(child)
+        file_item.addChildren(children)
+        self._shown += len(children)
+        self.results.addTopLevelItem(file_item)
+        file_item.setExpanded(True)
+        self.status_label.setText(f"Searching... {self._shown} result(s) in {self._files} file(s)")
+
+    def _on_finished(self, generation, files, total, elapsed):
+        if generation != self._generation:
+            return
+        self._generation = None
+        self.search_button.setText("🔍 Search")
+        note = f" (showing first {self._shown})" if total > self._shown else ""
+        self.status_label.setText(
+            f"✓ {total} result(s) in {self._files} file(s), {files} file(s) searched in {elapsed * 1000:.0f} ms{note}")
+
+    def _on_item_activated(self, item, column):
+        location = item.data(0, Qt.UserRole)
+        if location:
+            self.location_requested.emit(*location)
+
+    def clear_results(self, message=""):
+        """Sonuçları temizle; dosyalar değiştiyse eski sonuçlarla tekrar replace yapılamaz"""
+        self.cancel_search()
+        self.results.clear()
+        self._searched = None
+        self._matched_paths = []
+        self.status_label.setText(message)
+
+    def _on_replace_button(self):
+        """Tamamlanan aramanın eşleştiği dosyalarda değiştirme iste (önizleme IDE'de)"""
+        if self.is_searching:
+            self.status_label.setText("⚠ Wait for the search to finish before replacing")
+        elif self._searched is None or self._searched != self._query_key():
+            self.status_label.setText("⚠ Search first: replace uses the results of the last search")
+        elif not self._matched_paths:
+            self.status_label.setText("No matches to replace")
+        else:
+            # \1, \g<name> yalnızca regex modunda
+            self.replace_requested.emit(self._pattern, self.replace_input.text(),
+                                        self._searched[3], sorted(self._matched_paths))
+
+
+class DiffHighlighter(QSyntaxHighlighter):
+    """Unified diff satırlarını renklendir"""
+    COLORS = {'+': '#89d185', '-': '#f48771', '@': '#569cd6'}
+
+    def __init__(self, document):
+        super().__init__(document)
+        self.formats = {}
+        for prefix, color in self.COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self.formats[prefix] = fmt
+
+    def highlightBlock(self, text):
+        fmt = self.formats.get(text[:1])
+        if fmt is not None:
+            self.setFormat(0, len(text.encode('utf-16-le')) // 2, fmt)  # setFormat UTF-16 sayar
+
+
+class ReplacePreviewDialog(QDialog):
+    """Replace in Files önizlemesi: dosya başına diff, işaretli dosyalar uygulanır"""
+    MAX_DIFF_LINES = 5000
+
+    def __init__(self, entries, root, parent=None):
+        super().__init__(parent)
+        self.entries = entries
+        self.root = root
+        self.setWindowTitle("Replace in Files - Preview")
+        self.setMinimumSize(900, 600)
+
+        layout = QVBoxLayout(self)
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        splitter = QSplitter(Qt.Horizontal)
+        self.file_list = QListWidget()
+        for entry in entries:
+            item = QListWidgetItem(f"{os.path.relpath(entry.path, root)}  ({entry.count})")
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+            self.file_list.addItem(item)
+        self.file_list.currentRowChanged.connect(self._show_diff)
+        self.file_list.itemChanged.connect(self._update_summary)
+        splitter.addWidget(self.file_list)
+
+        self.diff_view = QPlainTextEdit()
+        self.diff_view.setReadOnly(True)
+        self.diff_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.diff_highlighter = DiffHighlighter(self.diff_view.document())
+        splitter.addWidget(self.diff_view)
+        splitter.setSizes([300, 600])
+        layout.addWidget(splitter)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.apply_button = QPushButton()
+        self.apply_button.setStyleSheet("background-color: #16825d; color: white;")
+        self.apply_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.apply_button)
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+
+        self.setStyleSheet("""
+            QListWidget, QPlainTextEdit {
+                background-color: #1e1e1e;
+                color: #d4d4d4;
+                border: 1px solid #3e3e3e;
+                font-family: 'Consolas', monospace;
+            }
+            QListWidget::item:selected {
+                background-color: #094771;
+            }
+        """)
+
+        self._update_summary()
+        if entries:
+            self.file_list.setCurrentRow(0)
+
+    def selected_entries(self):
+        return [entry for row, entry in enumerate(self.entries)
+                if self.file_list.item(row).checkState() == Qt.Checked]
+
+    def _update_summary(self, *args):
+        selected = self.selected_entries()
+        total = sum(entry.count for entry in self.entries)
+        self.summary_label.setText(f"{total} replacement(s) in {len(self.entries)} file(s), "
+                                   f"{len(selected)} file(s) selected")
+        self.apply_button.setText(f"Replace in {len(selected)} file(s)")
+        self.apply_button.setEnabled(bool(selected))
+
+    def _show_diff(self, row):
+        """Seçilen dosyanın diff'i yalnızca gösterildiğinde hesaplanır"""
+        if row < 0:
+            self.diff_view.clear()
+            return
+        entry = self.entries[row]
+        name = os.path.relpath(entry.path, self.root)
+        diff = difflib.unified_diff(entry.old_text.splitlines(), entry.new_text.splitlines(),
+                                    f"a/{name}", f"b/{name}", n=2, lineterm='')
+        lines = list(itertools.islice(diff, self.MAX_DIFF_LINES + 1))
+        if len(lines) > self.MAX_DIFF_LINES:
+            lines[-1] = f"... (diff truncated at {self.MAX_DIFF_LINES} lines)"
+        self.diff_view.setPlainText('\n'.join(lines))
+
+
 class GitManagerDialog(QDialog):
     """Git yöneticisi GUI"""
     def __init__(self, parent=None):
@@ -1317,6 +4469,7 @@ class ModernPythonIDE(QMainWindow):
 
         # Pencere ayarları
         self.tab_file_paths = {}  # Her tab için dosya yolunu sakla
+        self.find_dialog = None  # Ctrl+F dialog'u, ilk açılışta kurulur
         self.setWindowTitle("PyIDE - Professional Python Development Environment")
         self.setGeometry(100, 100, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
 
@@ -1735,8 +4888,15 @@ class ModernPythonIDE(QMainWindow):
         self.fs_watcher = QFileSystemWatcher()
         self._setup_fs_watcher(self.project_path)
         self.fs_watcher.directoryChanged.connect(self._on_directory_changed)
+        self._changed_dirs = set()  # Debounce süresince değişen klasörler
         
         self.populate_file_tree(self.project_path)
+        # Proje sembolleri arka planda indexlenir (autocomplete)
+        self.project_index = ProjectIndex.instance()
+        self.project_index.index(self.project_path)
+        # Find in Files için trigram index (değişen klasörlerle güncellenir)
+        self.trigram_index = TrigramIndex.instance()
+        self.trigram_index.index(self.project_path)
         
     def _on_file_tree_double_click(self, item, column):
         """Dosya tree'de double-click yapılınca dosyayı aç"""
@@ -1750,7 +4910,7 @@ class ModernPythonIDE(QMainWindow):
             self.fs_watcher.addPath(root_path)
             for dirpath, dirnames, _ in os.walk(root_path):
                 # Skip ignored directories
-                dirnames[:] = [d for d in dirnames if d not in {'.git', '__pycache__', '.vscode', '.idea', 'node_modules', 'venv', '.env'}]
+                dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
                 for dirname in dirnames:
                     full_path = os.path.join(dirpath, dirname)
                     self.fs_watcher.addPath(full_path)
@@ -1759,15 +4919,33 @@ class ModernPythonIDE(QMainWindow):
     
     def _on_directory_changed(self, path):
         """Klasör değiştiğinde otomatik refresh"""
+        self._changed_dirs.add(path)
         # Debounce: Çok sık refresh'i önle
         if hasattr(self, '_refresh_timer'):
             self._refresh_timer.stop()
         else:
             self._refresh_timer = QTimer()
             self._refresh_timer.setSingleShot(True)
-            self._refresh_timer.timeout.connect(lambda: self.populate_file_tree(self.project_path))
+            self._refresh_timer.timeout.connect(self._refresh_project)
         self._refresh_timer.start(500)  # 500ms bekle
     
+    def _refresh_project(self):
+        """File tree'yi ve indexleri güncelle (indexler yalnızca değişen dosyaları okur)"""
+        self.populate_file_tree(self.project_path)
+        self.project_index.index(self.project_path)
+        self.trigram_index.update(self._changed_dirs)
+        self._changed_dirs = set()
+
+    def _reindex_saved(self, path):
+        """Projedeki bir dosya kaydedilince arama ve (.py ise) sembol indexini tazele"""
+        root = os.path.join(os.path.abspath(self.project_path), '')
+        if not os.path.abspath(path).startswith(root):
+            return
+        # Yerinde yazılan dosya klasör bildirimi üretmez
+        self.trigram_index.update([path])
+        if path.endswith('.py'):
+            self.project_index.index(self.project_path)
+
     def _show_explorer_context_menu(self, position):
         """File tree sağ tık menüsü"""
         menu = QMenu()
@@ -1981,8 +5159,14 @@ class ModernPythonIDE(QMainWindow):
         # Terminal tab
         self.terminal = TerminalWidget()
         
+        # Find in Files tab
+        self.find_in_files = FindInFilesPanel(self.project_path)
+        self.find_in_files.location_requested.connect(self._open_location)
+        self.find_in_files.replace_requested.connect(self._replace_in_files)
+
         self.bottom_tabs.addTab(console_widget, "Output")
         self.bottom_tabs.addTab(self.terminal, "Terminal")
+        self.bottom_tabs.addTab(self.find_in_files, "Search")
         
         parent_splitter.addWidget(self.bottom_tabs)
 
@@ -2026,6 +5210,11 @@ class ModernPythonIDE(QMainWindow):
         find_action.setShortcut('Ctrl+F')
         find_action.triggered.connect(self._open_find_replace)
         edit_menu.addAction(find_action)
+
+        find_in_files_action = QAction('🔎 Find in Files', self)
+        find_in_files_action.setShortcut('Ctrl+Shift+F')
+        find_in_files_action.triggered.connect(self._open_find_in_files)
+        edit_menu.addAction(find_in_files_action)
         
         # Run menu
         run_menu = menubar.addMenu('Run')
@@ -2050,6 +5239,15 @@ class ModernPythonIDE(QMainWindow):
         git_action.triggered.connect(self._open_git_manager)
         tools_menu.addAction(git_action)
 
+        symbol_stats_action = QAction('📊 Symbol Cache İstatistikleri', self)
+        symbol_stats_action.triggered.connect(self._show_symbol_cache_stats)
+        tools_menu.addAction(symbol_stats_action)
+
+        paint_stats_action = QAction('⏱ Paint İstatistikleri (Status Bar)', self)
+        paint_stats_action.setCheckable(True)
+        paint_stats_action.toggled.connect(self._toggle_paint_stats)
+        tools_menu.addAction(paint_stats_action)
+
          # Tema Menüsü
         theme_menu = menubar.addMenu("🎨 Theme")
 
@@ -2124,20 +5322,43 @@ class ModernPythonIDE(QMainWindow):
 
     def setup_statusbar(self):
         self.statusBar().showMessage('PyIDE Ready | Created by Mert Ulupınar 🚀')
+        # Büyük dosya yükleme ilerlemesi
+        self.load_progress = QProgressBar()
+        self.load_progress.setMaximumWidth(200)
+        self.load_progress.setMaximumHeight(14)
+        self.load_progress.setRange(0, 100)
+        self.load_progress.hide()
+        self.statusBar().addPermanentWidget(self.load_progress)
 
     def add_new_tab(self, filename="Untitled"):
         editor = ModernCodeEditor()
+        editor.highlighter.parse_finished.connect(
+            lambda elapsed, reparsed, total, editor=editor: self._on_parse_finished(editor, elapsed, reparsed, total)
+        )
         tab_index = self.editor_tabs.addTab(editor, filename)
         self.editor_tabs.setCurrentIndex(tab_index)
         return editor
 
+    def _on_parse_finished(self, editor, elapsed, reparsed, total):
+        """Aktif editörün parse süresini status bar'da göster"""
+        if editor is self.get_current_editor() and reparsed:
+            self.statusBar().showMessage(f"Parse: {elapsed:.1f} ms ({reparsed}/{total} statement)", 3000)
+
     def close_tab(self, index):
         # Tab'ı kapatırken dosya yolunu da temizle
         if index in self.tab_file_paths:
             del self.tab_file_paths[index]
             
+        editor = self.editor_tabs.widget(index)
+        if editor.is_loading:
+            editor.cancel_loading()
+            self.load_progress.hide()
+
         if self.editor_tabs.count() > 1:
             self.editor_tabs.removeTab(index)
+            # Paylaşılan symbol registry referanslarını bırak
+            editor.highlighter.release_modules()
+            editor.deleteLater()
             # Index'leri yeniden düzenle
             self.tab_file_paths = {
                 i if i < index else i-1: path 
@@ -2170,21 +5391,64 @@ class ModernPythonIDE(QMainWindow):
                 return
                 
         try:
+            if os.path.getsize(filename) > ModernCodeEditor.STREAM_THRESHOLD:
+                self._open_large_file(filename)
+                return
+
             with open(filename, 'r', encoding='utf-8') as file:
                 content = file.read()
             
             editor = self.add_new_tab(os.path.basename(filename))
-            editor.setPlainText(content)
+            editor.set_text_lazily(content)
             tab_idx = self.editor_tabs.currentIndex()
             self.tab_file_paths[tab_idx] = filename
             self.statusBar().showMessage(f'Opened: {filename}')
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Could not open file:\n{str(e)}')
 
+    def _open_large_file(self, filename):
+        """Büyük dosyayı GUI'yi bloklamadan, parça parça aç"""
+        editor = self.add_new_tab(os.path.basename(filename))
+        self.tab_file_paths[self.editor_tabs.currentIndex()] = filename
+        loader = editor.load_file_streamed(filename)
+        size_mb = loader.total / (1024 * 1024)
+
+        def on_progress(done, total):
+            self.load_progress.setValue(int(done * 100 / max(1, total)))
+
+        def on_finished():
+            self.load_progress.hide()
+            disabled = [name for name, enabled in (
+                ('highlighting', editor.highlighting_enabled),
+                ('minimap', editor.minimap.detail),
+                ('autocomplete', editor.autocomplete_enabled)) if not enabled]
+            note = f" | Large file mode: {', '.join(disabled)} off" if disabled else ""
+            self.statusBar().showMessage(f'Opened: {filename} ({size_mb:.1f} MB){note}')
+
+        def on_failed(message):
+            self.load_progress.hide()
+            # Eksik içerik Ctrl+S ile gerçek dosyanın üzerine yazılmasın
+            tab_idx = self.editor_tabs.indexOf(editor)
+            if tab_idx >= 0:
+                self.tab_file_paths.pop(tab_idx, None)
+                self.editor_tabs.setTabText(tab_idx, f"{os.path.basename(filename)} (partial)")
+            QMessageBox.critical(self, 'Error', f'Could not open file:\n{message}')
+
+        loader.progress.connect(on_progress)
+        loader.finished.connect(on_finished)
+        loader.failed.connect(on_failed)
+        self.load_progress.setValue(0)
+        self.load_progress.show()
+        self.statusBar().showMessage(f'Loading: {filename} ({size_mb:.1f} MB)...')
+
     def save_file(self):
         current_editor = self.get_current_editor()
         if not current_editor:
             return
+        if current_editor.is_loading:
+            # Yarım yüklenmiş içerik dosyanın üzerine yazılmasın
+            self.statusBar().showMessage('File is still loading, save skipped', 3000)
+            return
         
         current_tab_idx = self.editor_tabs.currentIndex()
         current_file = self.tab_file_paths.get(current_tab_idx)
@@ -2194,6 +5458,7 @@ class ModernPythonIDE(QMainWindow):
                 with open(current_file, 'w', encoding='utf-8') as file:
                     file.write(current_editor.toPlainText())
                 self.statusBar().showMessage(f'Saved: {current_file}')
+                self._reindex_saved(current_file)
             except Exception as e:
                 QMessageBox.critical(self, 'Error', f'Could not save file:\n{str(e)}')
         else:
@@ -2214,6 +5479,7 @@ class ModernPythonIDE(QMainWindow):
                 self.tab_file_paths[current_tab_idx] = filename
                 self.editor_tabs.setTabText(current_tab_idx, os.path.basename(filename))
                 self.statusBar().showMessage(f'Saved: {filename}')
+                self._reindex_saved(filename)
             except Exception as e:
                 QMessageBox.critical(self, 'Error', f'Could not save file:\n{str(e)}')
 
@@ -2231,7 +5497,6 @@ class ModernPythonIDE(QMainWindow):
             # Yeni path'leri ekle
             self._setup_fs_watcher(root_path)
         
-        SKIP_DIRS = {'.git', '__pycache__', '.vscode', '.idea', 'node_modules', 'venv', '.env'}
         SHOW_EXTENSIONS = {'.py', '.txt', '.md', '.json', '.yaml', '.yml', '.toml', '.ini', '.cfg'}
 
         def add_items(parent_item, path):
@@ -2247,7 +5512,7 @@ class ModernPythonIDE(QMainWindow):
                 full_path = os.path.join(path, name)
                 is_dir = os.path.isdir(full_path)
 
-                if is_dir and name in SKIP_DIRS:
+                if is_dir and _skip_dir(name):
                     continue
                     
                 if not is_dir and not any(name.endswith(ext) for ext in SHOW_EXTENSIONS):
@@ -2386,9 +5651,125 @@ class ModernPythonIDE(QMainWindow):
         """Find & Replace dialog'u aç"""
         current_editor = self.get_current_editor()
         if current_editor:
-            dialog = FindReplaceDialog(current_editor, self)
-            dialog.show()  # Modeless dialog
+            # Pencere başına tek dialog: eşleşme vurgularını birden fazla dialog paylaşmasın
+            if self.find_dialog is None:
+                self.find_dialog = FindReplaceDialog(current_editor, self)
+            else:
+                self.find_dialog.set_editor(current_editor)
+            self.find_dialog.show()  # Modeless dialog
+            self.find_dialog.raise_()
+            self.find_dialog.activateWindow()
     
+    def _open_find_in_files(self):
+        """Search sekmesini aç; editörde seçili metin varsa sorguya al"""
+        panel = self.find_in_files
+        editor = self.get_current_editor()
+        if editor and editor.textCursor().hasSelection():
+            selected = editor.textCursor().selectedText()
+            if '\u2029' not in selected:  # Çok satırlı seçim sorgu olmaz
+                panel.query_input.setText(selected)
+        self.bottom_tabs.setCurrentWidget(panel)
+        panel.query_input.setFocus()
+        panel.query_input.selectAll()
+
+    def _open_location(self, path, line, column, length):
+        """Arama sonucuna git: dosyayı aç, eşleşmeyi seç"""
+        self.open_file_from_path(path)
+        editor = self.get_current_editor()
+        if editor is None or self.tab_file_paths.get(self.editor_tabs.currentIndex()) != path or editor.is_loading:
+            return
+        block = editor.document().findBlockByNumber(line - 1)
+        if not block.isValid():
+            return
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + min(column, block.length() - 1))
+        cursor.setPosition(block.position() + min(column + length, block.length() - 1), QTextCursor.KeepAnchor)
+        editor.setTextCursor(cursor)
+        editor.centerCursor()
+        editor.setFocus()
+
+    def _replace_in_files(self, pattern, replacement, expand, paths):
+        """Replace in Files: değişiklikleri hesapla, önizlet, onaylananları paralel yaz.
+
+        Değişiklikler diskteki içerikten hesaplanır. Dosyası açık tab'ın metni diskle aynıysa
+        yazıldıktan sonra diskten yeniden yüklenmeden tek düzenleme (tek undo adımı) ile
+        güncellenir; kaydedilmemiş değişikliği olan tab'ların dosyaları atlanır.
+        """
+        def key(path):
+            return os.path.normcase(os.path.abspath(path))
+
+        editors = {}
+        loading = set()
+        for tab_idx, path in self.tab_file_paths.items():
+            editor = self.editor_tabs.widget(tab_idx)
+            if editor.is_loading:
+                loading.add(key(path))  # Yarım yüklenmiş tab'ın dosyası değiştirilmez
+            else:
+                editors[key(path)] = editor
+        skipped_loading = [path for path in paths if key(path) in loading]
+        paths = [path for path in paths if key(path) not in loading]
+
+        started = time.perf_counter()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            entries, undecodable = ProjectSearch.plan_replacements(paths, pattern, replacement, expand)
+        except re.error as e:
+            self.find_in_files.status_label.setText(f"⚠ Invalid replacement: {e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        plan_time = time.perf_counter() - started
+
+        # Tab'daki metin diskten farklıysa ya kaydedilmemiş düzenleme var ya da tab eski:
+        # iki durumda da yazmak birinin değişikliğini kaybettirir
+        unsaved = []
+        pending = []
+        for entry in entries:
+            editor = editors.get(key(entry.path))
+            (unsaved if editor is not None and editor.raw_text() != entry.old_text else pending).append(entry)
+        entries = pending
+
+        skipped = [f"{len(files)} {reason}" for files, reason in (
+            (skipped_loading, "file(s) still loading"), (undecodable, "non UTF-8 file(s)"),
+            (unsaved, "file(s) with unsaved changes in a tab")) if files]
+        if not entries:
+            note = f" ({', '.join(skipped)} skipped)" if skipped else ""
+            self.find_in_files.status_label.setText(f"No changes to apply{note}")
+            return
+
+        dialog = ReplacePreviewDialog(entries, self.project_path, self)
+        if skipped:
+            dialog.summary_label.setText(f"{dialog.summary_label.text()} — skipped: {', '.join(skipped)}")
+        if dialog.exec_() != QDialog.Accepted:
+            return
+        selected = dialog.selected_entries()
+
+        started = time.perf_counter()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            written, changed, failed = ProjectSearch.write_replacements(selected)
+            for entry in written:
+                editor = editors.get(key(entry.path))
+                if editor is not None:
+                    editor.replace_all_matches(pattern, replacement, expand)
+        finally:
+            QApplication.restoreOverrideCursor()
+        elapsed = time.perf_counter() - started
+
+        count = sum(entry.count for entry in written)
+        message = (f"✓ Replaced {count} occurrence(s) in {len(written)} file(s) "
+                   f"(plan {plan_time * 1000:.0f} ms, write {elapsed * 1000:.0f} ms)")
+        if changed:
+            message += f", {len(changed)} file(s) changed on disk since preview were skipped"
+        self.find_in_files.clear_results(message)
+        self.statusBar().showMessage(message, 5000)
+        if failed:
+            details = '\n'.join(f"{entry.path}: {error}" for entry, error in failed[:20])
+            QMessageBox.warning(self, 'Replace in Files', f'Could not write {len(failed)} file(s):\n{details}')
+        self.trigram_index.update([entry.path for entry in written])
+        if any(entry.path.endswith('.py') for entry in written):
+            self.project_index.index(self.project_path)
+
     def _open_pip_manager(self):
         """Pip manager dialog'u aç"""
         dialog = PipManagerDialog(self)
@@ -2399,6 +5780,46 @@ class ModernPythonIDE(QMainWindow):
         dialog = GitManagerDialog(self)
         dialog.exec_()
     
+    def _show_symbol_cache_stats(self):
+        """Paylaşılan symbol registry hit/miss oranlarını göster"""
+        stats = SymbolRegistry.instance().stats()
+        QMessageBox.information(
+            self, "Symbol Cache",
+            f"Hits: {stats['hits']}\n"
+            f"Misses: {stats['misses']}\n"
+            f"Hit rate: {stats['hit_rate']:.0%}\n"
+            f"Cached modules: {stats['entries']} ({stats['referenced']} in use)\n"
+            f"Evictions: {stats['evictions']}"
+        )
+
+    def _toggle_paint_stats(self, enabled):
+        """Minimap/satır numarası FPS ve paint sürelerini status bar'da saniyede bir göster"""
+        if not hasattr(self, 'paint_stats_label'):
+            self.paint_stats_label = QLabel()
+            self.statusBar().addPermanentWidget(self.paint_stats_label)
+            self._paint_stats_timer = QTimer(self)
+            self._paint_stats_timer.timeout.connect(self._update_paint_stats)
+        self.paint_stats_label.setVisible(enabled)
+        if enabled:
+            self._paint_stats_timer.start(1000)
+            self._update_paint_stats()
+        else:
+            self._paint_stats_timer.stop()
+
+    def _update_paint_stats(self):
+        editor = self.get_current_editor()
+        if editor is None:
+            return
+        parts = []
+        for name, widget in (('Minimap', editor.minimap), ('Gutter', editor.line_number_area)):
+            fps, average, worst = widget.paint_stats.summary()
+            parts.append(f"{name} {fps:.0f} fps {average:.2f} ms (max {worst:.1f})")
+            widget.paint_stats.reset()
+        repaints = editor.repaints
+        parts.append(f"{repaints.requests} → {repaints.frames} updates")
+        repaints.requests = repaints.frames = 0
+        self.paint_stats_label.setText(' | '.join(parts))
+
     def run_debug(self):
         """Kodu debug modunda çalıştır (pdb ile)"""
         current_editor = self.get_current_editor()